@@ -2,45 +2,107 @@
 Health Check Endpoints
 System health and status endpoints
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Response
+from typing import Tuple
+import asyncio
+import time
+import orjson
 
 from app.schemas.models import HealthResponse
-from app.core.config import ProctoringConfig
-from app.core.dependencies import get_config
+from app.core.config import PROCTORING_DB_CONFIG
+from app.core.database import ping_database
 
 router = APIRouter()
 
+# Readiness probes share one DB ping per interval instead of one per request
+DB_CHECK_TTL_SECONDS = 1.0
+DB_CHECK_TIMEOUT_SECONDS = 0.25
+
+_db_check: Tuple[float, bool] = (float("-inf"), False)  # (checked_at, ok)
+_db_check_lock = asyncio.Lock()
+
+# Responses are static for the life of the process, so encode them once
+_HEALTH_BODY = orjson.dumps(HealthResponse(
+    status="healthy",
+    version="2.0.0",
+    components={
+        "api": "operational",
+        "video_processor": "operational",
+        "database": f"{PROCTORING_DB_CONFIG.DATABASE}_operational",
+        "mediapipe": "operational",
+        "opencv": "operational"
+    }
+).model_dump())
+
+_UNHEALTHY_BODY = orjson.dumps(HealthResponse(
+    status="unhealthy",
+    version="2.0.0",
+    components={
+        "api": "operational",
+        "video_processor": "operational",
+        "database": f"{PROCTORING_DB_CONFIG.DATABASE}_unavailable",
+        "mediapipe": "operational",
+        "opencv": "operational"
+    }
+).model_dump())
+
+_ROOT_BODY = orjson.dumps(HealthResponse(
+    status="operational",
+    version="2.0.0",
+    components={
+        "api": "healthy",
+        "video_processor": "ready",
+        "database": f"{PROCTORING_DB_CONFIG.DATABASE}_configured",
+        "detection_engine": "count_based_ready"
+    }
+).model_dump())
+
+
+async def _database_ready() -> bool:
+    """
+    Check database availability, reusing the last result for DB_CHECK_TTL_SECONDS
+
+    Returns:
+        True if a SELECT 1 round trip succeeded within DB_CHECK_TIMEOUT_SECONDS
+    """
+    global _db_check
+
+    async with _db_check_lock:
+        checked_at, ok = _db_check
+        if time.monotonic() - checked_at < DB_CHECK_TTL_SECONDS:
+            return ok
+
+        try:
+            await asyncio.wait_for(ping_database(), timeout=DB_CHECK_TIMEOUT_SECONDS)
+            ok = True
+        except Exception:
+            ok = False
+
+        _db_check = (time.monotonic(), ok)
+        return ok
+
+
+@router.get("/health/live", response_class=Response)
+async def liveness():
+    """
+    Liveness probe - the process is up and serving requests
+    """
+    return Response(content=b"OK", media_type="text/plain")
+
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check(config: ProctoringConfig = Depends(get_config)):
+async def health_check():
     """
-    Health check endpoint
+    Readiness check - verifies the database is reachable
     """
-    return HealthResponse(
-        status="healthy",
-        version="2.0.0",
-        components={
-            "api": "operational",
-            "video_processor": "operational",
-            "database": f"{config.MYSQL_DATABASE}_operational",
-            "mediapipe": "operational",
-            "opencv": "operational"
-        }
-    )
+    if await _database_ready():
+        return Response(content=_HEALTH_BODY, media_type="application/json")
+    return Response(content=_UNHEALTHY_BODY, status_code=503, media_type="application/json")
 
 
 @router.get("/", response_model=HealthResponse)
-async def root(config: ProctoringConfig = Depends(get_config)):
+async def root():
     """
     Root endpoint
     """
-    return HealthResponse(
-        status="operational",
-        version="2.0.0",
-        components={
-            "api": "healthy",
-            "video_processor": "ready",
-            "database": f"{config.MYSQL_DATABASE}_configured",
-            "detection_engine": "count_based_ready"
-        }
-    )
+    return Response(content=_ROOT_BODY, media_type="application/json")
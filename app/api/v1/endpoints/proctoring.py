@@ -2,13 +2,12 @@
 Proctoring Endpoints
 Request/response handling only - all logic in services
 """
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, Form, Depends
 from typing import Optional
 
 from app.schemas.models import ProcessVideoRequest
 from app.services.base_service import IProctoringService
 from app.core.dependencies import get_proctoring_service
-from app.core.exceptions import VideoProcessingError, DatabaseError, ValidationError
 
 router = APIRouter()
 
@@ -29,25 +28,10 @@ async def process_video_file(
     Returns:
         Analysis result with risk score and alerts
     """
-    try:
-        result = await proctoring_service.process_video_upload(
-            video_file=video,
-            interview_id=interview_id
-        )
-        return result
-
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail={"response": e.message, "code": e.code})
-    except VideoProcessingError as e:
-        raise HTTPException(status_code=500, detail={"response": e.message, "code": e.code})
-    except DatabaseError as e:
-        raise HTTPException(status_code=500, detail={"response": e.message, "code": e.code})
-    except Exception as e:
-        raise HTTPException(status_code=500, detail={
-            "response": "An unexpected error occurred",
-            "code": 5000,
-            "error": str(e)
-        })
+    return await proctoring_service.process_video_upload(
+        video_file=video,
+        interview_id=interview_id
+    )
 
 
 @router.post("/process-video-url")
@@ -64,22 +48,7 @@ async def process_video_url(
     Returns:
         Analysis result with risk score and alerts
     """
-    try:
-        result = await proctoring_service.process_video_from_url(
-            video_url=request.video_url,
-            interview_id=request.interview_id
-        )
-        return result
-
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail={"response": e.message, "code": e.code})
-    except VideoProcessingError as e:
-        raise HTTPException(status_code=500, detail={"response": e.message, "code": e.code})
-    except DatabaseError as e:
-        raise HTTPException(status_code=500, detail={"response": e.message, "code": e.code})
-    except Exception as e:
-        raise HTTPException(status_code=500, detail={
-            "response": "An unexpected error occurred",
-            "code": 5000,
-            "error": str(e)
-        })
+    return await proctoring_service.process_video_from_url(
+        video_url=request.video_url,
+        interview_id=request.interview_id
+    )
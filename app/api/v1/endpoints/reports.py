@@ -2,60 +2,101 @@
 Report Management Endpoints
 Request/response handling only - all logic in services
 """
-from fastapi import APIRouter, HTTPException, Depends
+from typing import AsyncIterator, Awaitable, Callable, Dict
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+import orjson
 
 from app.services.base_service import IProctoringService
 from app.core.dependencies import get_proctoring_service
-from app.core.exceptions import ReportNotFoundError, DatabaseError
+from app.core import cache
 
 router = APIRouter()
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+async def _cached_json_response(request: Request, key: str, load: Callable[[], Awaitable]) -> Response:
+    """
+    Serve a report payload from the TTL cache, honoring If-None-Match
+    """
+    entry = cache.get_cached(key)
+    if entry is None:
+        entry = cache.set_cached(key, orjson.dumps(await load()))
+    etag, body = entry
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+async def _ndjson_lines(rows: AsyncIterator[Dict]) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield orjson.dumps(row) + b"\n"
+
+
+async def _json_array_chunks(rows: AsyncIterator[Dict]) -> AsyncIterator[bytes]:
+    """Encode rows as one JSON array, emitted element by element"""
+    separator = b"["
+    async for row in rows:
+        yield separator + orjson.dumps(row)
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
 @router.get("/{session_id}")
 async def get_report(
     session_id: str,
+    request: Request,
     proctoring_service: IProctoringService = Depends(get_proctoring_service)
 ):
     """
     Retrieve proctoring report by session ID
     """
-    try:
-        result = proctoring_service.get_report(session_id)
-        return result
-
-    except ReportNotFoundError as e:
-        raise HTTPException(status_code=404, detail={"response": e.message, "code": e.code})
-    except DatabaseError as e:
-        raise HTTPException(status_code=500, detail={"response": e.message, "code": e.code})
-    except Exception as e:
-        raise HTTPException(status_code=500, detail={
-            "response": "An unexpected error occurred",
-            "code": 5000,
-            "error": str(e)
-        })
+    return await _cached_json_response(
+        request, cache.report_key(session_id), lambda: proctoring_service.get_report(session_id)
+    )
 
 
 @router.get("/candidate/{candidate_id}")
 async def get_candidate_reports(
     candidate_id: str,
-    limit: int = 10,
+    request: Request,
+    limit: int = Query(10, ge=1, le=100),
     proctoring_service: IProctoringService = Depends(get_proctoring_service)
 ):
     """
     Retrieve all proctoring reports for a candidate
     """
-    try:
-        result = proctoring_service.get_candidate_reports(candidate_id, limit)
-        return result
+    return await _cached_json_response(
+        request,
+        cache.candidate_key(candidate_id, limit),
+        lambda: proctoring_service.get_candidate_reports(candidate_id, limit)
+    )
 
-    except DatabaseError as e:
-        raise HTTPException(status_code=500, detail={"response": e.message, "code": e.code})
-    except Exception as e:
-        raise HTTPException(status_code=500, detail={
-            "response": "An unexpected error occurred",
-            "code": 5000,
-            "error": str(e)
-        })
+
+@router.get("/candidate/{candidate_id}/stream")
+async def stream_candidate_reports(
+    candidate_id: str,
+    request: Request,
+    limit: int = Query(100, ge=1, le=10000),
+    proctoring_service: IProctoringService = Depends(get_proctoring_service)
+):
+    """
+    Stream proctoring reports for a candidate as NDJSON (one report per line),
+    or as a single JSON array when the client sends Accept: application/json
+    """
+    reports = proctoring_service.stream_candidate_reports(candidate_id, limit)
+    if "application/json" in request.headers.get("accept", ""):
+        return StreamingResponse(_json_array_chunks(reports), media_type="application/json")
+    return StreamingResponse(_ndjson_lines(reports), media_type="application/x-ndjson")
 
 
 @router.delete("/{session_id}")
@@ -66,17 +107,4 @@ async def delete_report(
     """
     Delete proctoring report (GDPR compliance)
     """
-    try:
-        result = proctoring_service.delete_report(session_id)
-        return result
-
-    except ReportNotFoundError as e:
-        raise HTTPException(status_code=404, detail={"response": e.message, "code": e.code})
-    except DatabaseError as e:
-        raise HTTPException(status_code=500, detail={"response": e.message, "code": e.code})
-    except Exception as e:
-        raise HTTPException(status_code=500, detail={
-            "response": "An unexpected error occurred",
-            "code": 5000,
-            "error": str(e)
-        })
+    return await proctoring_service.delete_report(session_id)
@@ -3,11 +3,12 @@ Central router configuration
 Consolidates all API v1 endpoints
 """
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from .endpoints import health, proctoring, reports
 
-# Create main API router
-api_router = APIRouter()
+# Create main API router (orjson serialization for every endpoint)
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include all endpoint routers
 api_router.include_router(health.router, tags=["Health"])
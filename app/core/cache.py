@@ -0,0 +1,50 @@
+"""
+In-process response cache for report reads.
+
+Reports are written once per interview, so repeat polls (dashboard refresh)
+can be answered from serialized bytes without touching the database.
+State is per process: with multiple workers each keeps its own cache and a
+write in one worker is only seen by the others after the TTL expires.
+"""
+import hashlib
+from typing import Optional, Tuple
+
+from cachetools import TTLCache
+
+REPORT_CACHE_MAXSIZE = 1024
+REPORT_CACHE_TTL_SECONDS = 30
+
+# key -> (etag, serialized JSON body)
+_report_cache: TTLCache = TTLCache(maxsize=REPORT_CACHE_MAXSIZE, ttl=REPORT_CACHE_TTL_SECONDS)
+
+
+def report_key(session_id: str) -> str:
+    return f"report:{session_id}"
+
+
+def candidate_key(candidate_id: str, limit: int) -> str:
+    return f"candidate:{candidate_id}:{limit}"
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag derived from the serialized response body"""
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def get_cached(key: str) -> Optional[Tuple[str, bytes]]:
+    return _report_cache.get(key)
+
+
+def set_cached(key: str, body: bytes) -> Tuple[str, bytes]:
+    entry = (compute_etag(body), body)
+    _report_cache[key] = entry
+    return entry
+
+
+def invalidate_report(session_id: str) -> None:
+    """
+    Drop a report and every candidate listing, which may include it
+    """
+    _report_cache.pop(report_key(session_id), None)
+    for key in [k for k in _report_cache if k.startswith("candidate:")]:
+        _report_cache.pop(key, None)
@@ -3,11 +3,27 @@ Configuration settings for the AI Interviewer application.
 """
 from pathlib import Path
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict
 from dotenv import load_dotenv
+
+from app.core.exceptions import ConfigurationError
 import os
 
-load_dotenv()
+
+def load_env() -> None:
+    """
+    Load .env into the process environment once.
+    The marker is inherited by spawned workers, and deployments that inject
+    the environment directly (Docker/K8s) can set APP_ENV_LOADED=1 to skip the file.
+    """
+    if os.getenv("APP_ENV_LOADED"):
+        return
+    load_dotenv()
+    os.environ["APP_ENV_LOADED"] = "1"
+
+
+load_env()
 
 # ROOT_DIR = "/mnt/ai_question_generator"
 ROOT_DIR = Path(__file__).resolve().parents[2]
@@ -64,34 +80,68 @@ class PathConfig:
 class ProctoringDatabaseConfig:
     """
     Database configuration for the AI Proctoring System.
-    All values are driven by environment variables with safe fallbacks.
+    All values are driven by environment variables with safe fallbacks,
+    resolved on first access and cached for the life of the instance.
     """
 
-    @property
+    @cached_property
     def HOST(self) -> str:
         return os.getenv("MYSQL_HOST", "localhost")
 
-    @property
+    @cached_property
     def PORT(self) -> int:
-        return int(os.getenv("MYSQL_PORT", "3306") or "3306")
-
-    @property
+        raw = os.getenv("MYSQL_PORT") or "3306"
+        try:
+            port = int(raw)
+        except ValueError:
+            raise ConfigurationError(f"MYSQL_PORT must be an integer, got {raw!r}", 5020) from None
+        if not 1 <= port <= 65535:
+            raise ConfigurationError(f"MYSQL_PORT must be between 1 and 65535, got {port}", 5020)
+        return port
+
+    @cached_property
     def USER(self) -> str:
         return os.getenv("MYSQL_USER", "root")
 
-    @property
+    @cached_property
     def PASSWORD(self) -> str:
         return os.getenv("MYSQL_PASSWORD", "").strip()
 
-    @property
+    @cached_property
     def DATABASE(self) -> str:
         return os.getenv("MYSQL_DATABASE", "proctoring")
 
+    # ── Connection Pool ───────────────────────────────────────────────────
+
+    @cached_property
+    def POOL_SIZE(self) -> int:
+        return int(os.getenv("DB_POOL_SIZE", "20"))
+
+    @cached_property
+    def MAX_OVERFLOW(self) -> int:
+        return int(os.getenv("DB_OVERFLOW", "40"))
+
+    @cached_property
+    def POOL_TIMEOUT(self) -> int:
+        return int(os.getenv("DB_POOL_TIMEOUT", "5"))
+
+    @cached_property
+    def POOL_RECYCLE(self) -> int:
+        # Recycle before typical proxy/LB idle cutoffs and well under MySQL wait_timeout
+        return int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+    # ── ORM Safety ────────────────────────────────────────────────────────
+
+    @cached_property
+    def STRICT_ORM(self) -> bool:
+        """Raise on any lazy relationship load instead of emitting per-row SELECTs"""
+        return os.getenv("PROCTORING_STRICT_ORM", "0").strip().lower() in ("1", "true", "yes")
+
     @property
     def connection_url(self) -> str:
         """Construct a MySQL connection URL from env variables."""
         return (
-            f"mysql+pymysql://{self.USER}:{self.PASSWORD}"
+            f"mysql+asyncmy://{self.USER}:{self.PASSWORD}"
             f"@{self.HOST}:{self.PORT}/{self.DATABASE}"
         )
 
@@ -106,7 +156,7 @@ class ProctoringDatabaseConfig:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProctoringConfig:
     """
     Configuration for AI Proctoring System.
@@ -116,8 +166,13 @@ class ProctoringConfig:
 
     # ── Video Processing ──────────────────────────────────────────────────
     MAX_FRAME_DIMENSION: int   = 1280
+    MEDIAPIPE_INPUT_MAX_DIMENSION: int = 0     # >0 downscales FaceMesh input to this; faster, but coarser iris/gaze landmarks
+    ENABLE_HW_DECODE: bool     = False     # request FFmpeg hardware decode (VAAPI/D3D11/MFX); falls back to software
     TARGET_FPS: int            = 18        # balance: better temporal resolution, still efficient (15–25 typical)
     WARMUP_SECONDS: float      = 3.0       # ignore violations in first N seconds (removes 0:00 false positives)
+    SKIP_DUPLICATE_FRAMES: bool = False    # reuse FaceMesh landmarks for near-identical consecutive frames
+    DUPLICATE_FRAME_MAX_DIFF: float = 1.5  # mean abs pixel difference (0–255) on a 32x32 thumbnail
+    DUPLICATE_FRAME_MAX_REUSE: int  = 5    # force a fresh inference after this many reused frames
 
     # ── Gaze & Pose Thresholds (Calibration-Free) ─────────────────────────
     FIXED_EYE_HORIZONTAL_THRESHOLD: float = 6.0    # degrees; reduced false flags on wide monitors
@@ -182,11 +237,7 @@ class ProctoringConfig:
     # ── Processing Limits ─────────────────────────────────────────────────
     ENABLE_ASYNC_PROCESSING: bool  = True
     MAX_VIDEO_SIZE_MB: int         = 500
-    ALLOWED_VIDEO_FORMATS: list    = None
-
-    def __post_init__(self):
-        if self.ALLOWED_VIDEO_FORMATS is None:
-            self.ALLOWED_VIDEO_FORMATS = ['.mp4', '.avi', '.mov', '.webm', '.mkv']
+    ALLOWED_VIDEO_FORMATS: tuple   = ('.mp4', '.avi', '.mov', '.webm', '.mkv')
 
     # ── Context-aware Proctoring (safe downwards look) ───────────────────
     SAFE_DOWN_MAX_VELOCITY_DEG_PER_S: float = 5.0    # very slow only = writing/thinking
@@ -3,20 +3,63 @@ Database Configuration
 SQLAlchemy setup and session management
 """
 from app.utils.logger import debug_logger
-from sqlalchemy import create_engine, text, URL
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-
-# Create declarative base for models
-Base = declarative_base()
+from sqlalchemy import inspect, text, String, URL
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+import asyncio
+import logging
+
+import orjson
+
+class Base(DeclarativeBase):
+    """Declarative base for all ORM models"""
+    pass
 
 # Global engine and session factory
 engine = None
 SessionLocal = None
 
+# Session bound to the current request; read by the singleton repositories
+current_db_session: ContextVar[Optional[AsyncSession]] = ContextVar("current_db_session", default=None)
+
+
+def _orjson_dumps(value) -> str:
+    """JSON column serializer: orjson output as the str the dialect expects"""
+    return orjson.dumps(value).decode()
+
 
-def init_database(config):
+@lru_cache(maxsize=8)
+def _build_database_url(user: str, password: str, host: str, port: int,
+                        database: Optional[str] = None) -> URL:
+    """
+    Build the asyncmy connection URL (cached per distinct settings)
+
+    Args:
+        user: MySQL user
+        password: MySQL password (omitted from the URL when empty)
+        host: MySQL host
+        port: MySQL port
+        database: Database name, or None for a server-level connection
+
+    Returns:
+        SQLAlchemy URL
+    """
+    return URL.create(
+        drivername="mysql+asyncmy",
+        username=user,
+        password=password or None,
+        host=host,
+        port=port,
+        database=database,
+        query={"charset": "utf8mb4"}
+    )
+
+
+async def init_database(config):
     """
     Initialize database engine and session factory
     Creates database if it doesn't exist
@@ -33,83 +76,64 @@ def init_database(config):
         mysql_password = config.PASSWORD
         mysql_database = config.DATABASE
 
-        debug_logger.info(f"Initializing database connection...")
-        debug_logger.info(f"Host: {mysql_host}")
-        debug_logger.info(f"Port: {mysql_port}")
-        debug_logger.info(f"User: {mysql_user}")
-        debug_logger.info(f"Database: {mysql_database}")
+        if debug_logger.isEnabledFor(logging.INFO):
+            debug_logger.info(
+                f"Initializing database connection: "
+                f"{mysql_user}@{mysql_host}:{mysql_port}/{mysql_database}"
+            )
 
         # Step 1: Connect to MySQL without database to create database
-        debug_logger.info("Connecting to MySQL server to create database...")
-
-        temp_url_params = {
-            "drivername": "mysql+pymysql",
-            "username": mysql_user,
-            "host": mysql_host,
-            "port": mysql_port,
-            "query": {"charset": "utf8mb4"}
-        }
-
-        if mysql_password:
-            temp_url_params["password"] = mysql_password
-
-        temp_database_url = URL.create(**temp_url_params)
-        temp_engine = create_engine(
+        temp_database_url = _build_database_url(mysql_user, mysql_password, mysql_host, mysql_port)
+        temp_engine = create_async_engine(
             temp_database_url,
             connect_args={"connect_timeout": 10},
             echo=False
         )
 
         try:
-            with temp_engine.connect() as conn:
-                # Test connection
-                result = conn.execute(text("SELECT 1"))
-                debug_logger.info(f"Connected to MySQL server: {result.scalar()}")
-
-                # Create database if it doesn't exist
-                debug_logger.info(f"Creating database '{mysql_database}' if it doesn't exist...")
-                conn.execute(text(f"CREATE DATABASE IF NOT EXISTS `{mysql_database}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"))
-                conn.commit()
+            async with temp_engine.connect() as conn:
+                # Create database if it doesn't exist (also proves the server is reachable)
+                await conn.execute(text(f"CREATE DATABASE IF NOT EXISTS `{mysql_database}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"))
+                await conn.commit()
                 debug_logger.info(f"Database '{mysql_database}' ready")
         finally:
-            temp_engine.dispose()
+            await temp_engine.dispose()
 
         # Step 2: Create main engine with database specified
-        debug_logger.info(f"Connecting to database '{mysql_database}'...")
-
-        main_url_params = {
-            "drivername": "mysql+pymysql",
-            "username": mysql_user,
-            "host": mysql_host,
-            "port": mysql_port,
-            "database": mysql_database,
-            "query": {"charset": "utf8mb4"}
-        }
-
-        if mysql_password:
-            main_url_params["password"] = mysql_password
-
-        main_database_url = URL.create(**main_url_params)
+        main_database_url = _build_database_url(
+            mysql_user, mysql_password, mysql_host, mysql_port, mysql_database
+        )
 
-        engine = create_engine(
+        # LIFO checkout keeps a small hot set of connections in use under light
+        # load; a short pool_timeout fails fast instead of queueing requests
+        engine = create_async_engine(
             main_database_url,
             pool_pre_ping=True,
-            pool_recycle=3600,
-            pool_size=5,
-            max_overflow=10,
+            pool_recycle=config.POOL_RECYCLE,
+            pool_size=config.POOL_SIZE,
+            max_overflow=config.MAX_OVERFLOW,
+            pool_timeout=config.POOL_TIMEOUT,
+            pool_use_lifo=True,
+            # JSON columns encode/decode with orjson instead of stdlib json
+            json_serializer=_orjson_dumps,
+            json_deserializer=orjson.loads,
             echo=False,
             connect_args={"connect_timeout": 10}
         )
 
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT 1"))
             debug_logger.info(f"Connected to database '{mysql_database}': {result.scalar()}")
 
+        await _warm_pool(engine, config.POOL_SIZE)
+
         # Step 3: Create session factory
-        SessionLocal = sessionmaker(
-            autocommit=False,
+        # Objects stay readable after commit, so to_dict() never triggers a lazy refresh
+        SessionLocal = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
             autoflush=False,
-            bind=engine
+            expire_on_commit=False
         )
 
         debug_logger.info("[OK] Database engine initialized successfully")
@@ -118,7 +142,7 @@ def init_database(config):
     except ImportError as e:
         debug_logger.error(
             f"[ERROR] Database driver not found: {e}\n"
-            "Please install: pip install pymysql cryptography"
+            "Please install: pip install asyncmy cryptography"
         )
         raise
     except Exception as e:
@@ -126,8 +150,108 @@ def init_database(config):
         raise
 
 
-def create_tables():
-    """Create all database tables using SQLAlchemy ORM models"""
+async def _warm_pool(engine, size: int) -> None:
+    """
+    Open `size` pooled connections up front so the first requests after
+    startup don't each pay the MySQL connect/auth handshake
+
+    Args:
+        engine: Async engine whose pool should be filled
+        size: Number of connections to open (normally pool_size)
+    """
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(size)),
+        return_exceptions=True
+    )
+    conns = [r for r in results if not isinstance(r, BaseException)]
+    try:
+        # A bad connection is counted as a failure, not raised out of startup
+        pings = await asyncio.gather(
+            *(conn.execute(text("SELECT 1")) for conn in conns),
+            return_exceptions=True
+        )
+    finally:
+        # Closing returns each connection to the pool rather than disconnecting
+        await asyncio.gather(*(conn.close() for conn in conns), return_exceptions=True)
+
+    failed = len(results) - len(conns) + sum(isinstance(p, BaseException) for p in pings)
+    if failed:
+        debug_logger.warning(f"Connection pool warm-up: {failed} of {size} connections failed")
+    else:
+        debug_logger.info(f"Connection pool warmed with {size} connections")
+
+
+# Tables whose `id` primary key moved from VARCHAR(36) to BINARY(16)
+_BINARY_ID_TABLES = ("proctoring_events_logs", "proctoring_event_summary")
+
+# Indexes from older schemas that other indexes now cover: table -> names
+_OBSOLETE_INDEXES = {
+    "proctoring_events_logs": (
+        "ix_proctoring_events_logs_interview_id",
+        "ix_proctoring_events_logs_event_type",
+    ),
+    "proctoring_event_summary": (
+        "ix_proctoring_event_summary_interview_id",
+        "ix_proctoring_event_summary_event_type",
+    ),
+    "proctoring_reports": (
+        "ix_proctoring_reports_cheating_likelihood_level",
+        "idx_interview_created",
+    ),
+}
+
+
+def _varchar_id_tables(sync_conn) -> list:
+    """Existing tables from _BINARY_ID_TABLES whose `id` is still a text column"""
+    inspector = inspect(sync_conn)
+    existing = set(inspector.get_table_names())
+    return [
+        table for table in _BINARY_ID_TABLES
+        if table in existing and any(
+            col["name"] == "id" and isinstance(col["type"], String)
+            for col in inspector.get_columns(table)
+        )
+    ]
+
+
+def _upgrade_schema(sync_conn) -> None:
+    """
+    Convert VARCHAR(36) UUID primary keys to BINARY(16) in place, keeping rows,
+    and drop indexes the current models no longer define.
+    No-op once the schema is current.
+    """
+    inspector = inspect(sync_conn)
+    existing = set(inspector.get_table_names())
+    for table, obsolete in _OBSOLETE_INDEXES.items():
+        if table not in existing:
+            continue
+        present = {index["name"] for index in inspector.get_indexes(table)}
+        for name in obsolete:
+            if name in present:
+                sync_conn.execute(text(f"DROP INDEX `{name}` ON `{table}`"))
+                debug_logger.warning(f"Dropped obsolete index {name} on {table}")
+
+    for table in _varchar_id_tables(sync_conn):
+        sync_conn.execute(text(f"ALTER TABLE `{table}` ADD COLUMN id_bin BINARY(16) NULL AFTER id"))
+        # Same byte order as uuid.UUID(...).bytes, which BinaryUUID binds
+        sync_conn.execute(text(f"UPDATE `{table}` SET id_bin = UNHEX(REPLACE(id, '-', ''))"))
+        sync_conn.execute(text(
+            f"ALTER TABLE `{table}` DROP PRIMARY KEY, DROP COLUMN id, "
+            f"CHANGE COLUMN id_bin id BINARY(16) NOT NULL FIRST, ADD PRIMARY KEY (id)"
+        ))
+        debug_logger.warning(f"Converted {table}.id from VARCHAR(36) to BINARY(16)")
+
+
+async def create_tables(reset: bool = False):
+    """
+    Create missing database tables from the SQLAlchemy ORM models
+    Idempotent: existing tables are kept (CREATE TABLE IF NOT EXISTS) and only
+    upgraded where an older schema stored UUID ids as VARCHAR(36)
+
+    Args:
+        reset: Drop the proctoring tables first so they are recreated with the
+               current schema (destroys data; development only)
+    """
     global engine
     if engine is None:
         raise RuntimeError("Database not initialized. Call init_database() first.")
@@ -140,18 +264,18 @@ def create_tables():
             ProctoringEventSummary
         )
 
-        # Drop existing proctoring tables so they are recreated with the new schema
-        # (interview_id as PK on proctoring_reports; events/summary FK to proctoring_reports)
-        with engine.connect() as conn:
-            conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
-            conn.execute(text("DROP TABLE IF EXISTS proctoring_events_logs"))
-            conn.execute(text("DROP TABLE IF EXISTS proctoring_event_summary"))
-            conn.execute(text("DROP TABLE IF EXISTS proctoring_reports"))
-            conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
-            conn.commit()
-
-        # Create all tables from registered models (proctoring_reports first due to FKs)
-        Base.metadata.create_all(bind=engine)
+        async with engine.begin() as conn:
+            if reset:
+                await conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+                await conn.execute(text("DROP TABLE IF EXISTS proctoring_events_logs"))
+                await conn.execute(text("DROP TABLE IF EXISTS proctoring_event_summary"))
+                await conn.execute(text("DROP TABLE IF EXISTS proctoring_reports"))
+                await conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+                debug_logger.warning("Dropped proctoring tables for schema reset")
+
+            # Create all tables from registered models (proctoring_reports first due to FKs)
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_upgrade_schema)
         debug_logger.info("[OK] Database tables created successfully")
 
     except Exception as e:
@@ -159,51 +283,94 @@ def create_tables():
         raise
 
 
-@contextmanager
-def get_db() -> Session:
+async def verify_schema() -> None:
+    """
+    Fail startup when the tables predate the BINARY(16) id columns; BinaryUUID
+    would otherwise write raw bytes into VARCHAR ids and fail on every read
+
+    Raises:
+        RuntimeError: If the database is not initialized or needs create_tables()
+    """
+    if engine is None:
+        raise RuntimeError("Database not initialized. Call init_database() first.")
+
+    async with engine.connect() as conn:
+        outdated = await conn.run_sync(_varchar_id_tables)
+    if outdated:
+        raise RuntimeError(
+            f"Database schema is out of date: {', '.join(outdated)} still use VARCHAR(36) ids. "
+            "Run create_tables() once (see README, 'Initialize Database Schema') to upgrade."
+        )
+
+
+async def ping_database() -> None:
+    """
+    Run a trivial query on a pooled connection
+
+    Raises:
+        RuntimeError: If the database has not been initialized
+        Exception: Any driver/pool error from the round trip
+    """
+    if engine is None:
+        raise RuntimeError("Database not initialized. Call init_database() first.")
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def dispose_database():
+    """Close all pooled connections (call on application shutdown)"""
+    global engine
+    if engine is not None:
+        await engine.dispose()
+        debug_logger.info("Database connection pool disposed")
+
+
+@asynccontextmanager
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Get database session context manager
 
     Usage:
-        with get_db() as db:
-            db.query(Model).all()
+        async with get_db() as db:
+            await db.execute(select(Model))
 
     Yields:
-        SQLAlchemy Session
+        SQLAlchemy AsyncSession
     """
     global SessionLocal
     if SessionLocal is None:
         raise RuntimeError("Database not initialized. Call init_database() first.")
 
-    db = SessionLocal()
-    try:
-        yield db
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    async with SessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
 
 
-def get_db_session() -> Session:
+async def get_db_session() -> AsyncIterator[AsyncSession]:
     """
     Get database session for dependency injection
+    The session is also bound to current_db_session for the request's duration
 
     Usage with FastAPI:
         @app.get("/")
-        def endpoint(db: Session = Depends(get_db_session)):
+        async def endpoint(db: AsyncSession = Depends(get_db_session)):
             ...
 
     Yields:
-        SQLAlchemy Session
+        SQLAlchemy AsyncSession
     """
     global SessionLocal
     if SessionLocal is None:
         raise RuntimeError("Database not initialized. Call init_database() first.")
 
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    async with SessionLocal() as db:
+        current_db_session.set(db)
+        try:
+            yield db
+        finally:
+            current_db_session.set(None)
@@ -3,10 +3,15 @@ Dependency Injection
 Clean dependency management following FastAPI best practices
 """
 from app.utils.logger import debug_logger
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+import multiprocessing
+import os
+
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import ProctoringConfig
+from app.core.config import ProctoringConfig, PROCTORING_CONFIG
 from app.core.database import get_db_session
 from app.repositories.base_repository import IRepository
 from app.repositories.proctoring_repository import ProctoringRepository
@@ -16,36 +21,88 @@ from app.models.proctoring import ProctoringReport
 
 logger = debug_logger
 
+# Process pool for CPU-bound video analysis (created on first use)
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Stateless singletons; the repository resolves the request's session from
+# current_db_session, which get_db_session binds once per request
+_repository = ProctoringRepository()
+_proctoring_service: Optional[ProctoringService] = None
+
 def get_config() -> ProctoringConfig:
     """
     Get configuration instance
-    Returns singleton configuration instance
+    Returns the shared (frozen) configuration instance
 
     Returns:
         ProctoringConfig instance
     """
-    return ProctoringConfig()
+    return PROCTORING_CONFIG
+
+
+def _process_pool_size() -> int:
+    """
+    Analysis processes for this web worker: VIDEO_POOL_WORKERS if set,
+    otherwise the CPU count split across the WEB_CONCURRENCY web workers
+    (each of which runs its own pool), at least one
+    """
+    configured = os.getenv("VIDEO_POOL_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    web_workers = int(os.getenv("GUNICORN_WORKERS") or os.getenv("WEB_CONCURRENCY") or "1")
+    return max(1, (os.cpu_count() or 1) // max(1, web_workers))
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared process pool used for video analysis
+    Workers are spawned rather than forked so they never inherit the
+    server's threads or open DB connections
+
+    Returns:
+        ProcessPoolExecutor, or None when ENABLE_ASYNC_PROCESSING is off
+    """
+    global _process_pool
+    if not PROCTORING_CONFIG.ENABLE_ASYNC_PROCESSING:
+        return None
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=_process_pool_size(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(f"Video process pool started with {_process_pool._max_workers} workers")
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the video process pool if it was started"""
+    global _process_pool, _proctoring_service
+    # The service holds the executor, so rebuild it on next use
+    _proctoring_service = None
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True, cancel_futures=True)
+        _process_pool = None
 
 
-def get_repository(db: Session = Depends(get_db_session)) -> IRepository[ProctoringReport]:
+def get_repository(db: AsyncSession = Depends(get_db_session)) -> IRepository[ProctoringReport]:
     """
-    Get repository instance with injected database session
+    Get repository instance bound to the request's database session
     Returns base interface type for better abstraction and testability
     The concrete implementation (ProctoringRepository) extends BaseRepository
 
     Args:
-        db: Database session from FastAPI dependency
+        db: Database session from FastAPI dependency; resolving it binds the
+            session to current_db_session, where the shared repository reads it
 
     Returns:
         Repository instance implementing IRepository interface
     """
-    # BaseRepository is called through inheritance in ProctoringRepository
-    # ProctoringRepository(db) -> calls BaseRepository.__init__(ProctoringReport, db)
-    return ProctoringRepository(db=db)
+    return _repository
 
 
 def get_proctoring_service(
-    repository: IRepository[ProctoringReport] = Depends(get_repository)
+    repository: IRepository[ProctoringReport] = Depends(get_repository),
+    process_pool: Optional[ProcessPoolExecutor] = Depends(get_process_pool)
 ) -> IProctoringService:
     """
     Get proctoring service instance with proper dependency injection
@@ -53,8 +110,12 @@ def get_proctoring_service(
 
     Args:
         repository: Injected repository implementing IRepository base interface
+        process_pool: Injected executor for CPU-bound video analysis
 
     Returns:
         Proctoring service instance implementing IProctoringService
     """
-    return ProctoringService(repository=repository)
+    global _proctoring_service
+    if _proctoring_service is None:
+        _proctoring_service = ProctoringService(repository=repository, executor=process_pool)
+    return _proctoring_service
@@ -8,6 +8,8 @@ class AppError(Exception):
     def __init__(self, message: str, code: int):
         self.message = message
         self.code = code
+        # Response payload built once, reused by the API exception handler
+        self.detail = {"response": message, "code": code}
         super().__init__(self.message)
 
 class ConfigurationError(AppError):
@@ -34,3 +36,14 @@ class ReportNotFoundError(AppError):
     """Exception when report is not found"""
     def __init__(self):
         super().__init__("Report not found", 404)
+
+
+# HTTP status returned for each error type; anything else maps to 500
+STATUS_MAP = {
+    ValidationError: 400,
+    ReportNotFoundError: 404,
+    VideoProcessingError: 500,
+    VideoDownloadError: 500,
+    DatabaseError: 500,
+    ConfigurationError: 500,
+}
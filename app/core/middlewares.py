@@ -5,18 +5,29 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import time
-from typing import Dict, Tuple
-from collections import defaultdict
+from typing import NamedTuple, Tuple
+from collections import OrderedDict
 
-from dotenv import load_dotenv
+from app.core.config import RATE_LIMIT_CONFIG, CORS_CONFIG, PROCTORING_CONFIG
+from app.utils.logger import debug_logger
 
-from app.core.config import RATE_LIMIT_CONFIG, CORS_CONFIG
+# Allowance on top of the video size limit for multipart boundaries and form fields
+UPLOAD_BODY_OVERHEAD_BYTES = 64 * 1024
 
-load_dotenv()
+# In-memory storage for rate limiting, kept in least-recently-seen order and
+# capped so spraying requests from many IPs cannot grow it without bound.
+# State is per process: with multiple workers each enforces its own limit, so
+# production deployments should move this to a shared store (e.g. Redis INCR + EXPIRE)
+MAX_TRACKED_CLIENTS = 100_000
+# Each entry is (window_bucket, request_count) for a fixed-window counter
+rate_limit_storage: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of a rate limit check for one request"""
+    limited: bool
+    retry_after: int
 
-# In-memory storage for rate limiting
-# In production, consider using Redis or another persistent store
-rate_limit_storage: Dict[str, Tuple[int, float]] = defaultdict(lambda: (0, 0.0))
 
 class RateLimitMiddleware:
     """Rate limiting middleware for FastAPI"""
@@ -34,14 +45,15 @@ class RateLimitMiddleware:
         request = Request(scope, receive)
         client_ip = self._get_client_ip(request)
         
-        if not self._is_rate_limited(client_ip):
+        decision = self._check_rate_limit(client_ip)
+        if not decision.limited:
             await self.app(scope, receive, send)
         else:
             response = JSONResponse(
                 status_code=429,
                 content={
                     "detail": "Rate limit exceeded. Maximum 60 requests per minute allowed.",
-                    "retry_after": self._get_retry_after(client_ip)
+                    "retry_after": decision.retry_after
                 }
             )
             await response(scope, receive, send)
@@ -62,28 +74,135 @@ class RateLimitMiddleware:
         # Fallback to direct client IP
         return request.client.host if request.client else "unknown"
     
-    def _is_rate_limited(self, client_ip: str) -> bool:
-        """Check if client IP is rate limited"""
-        current_time = time.time()
-        request_count, window_start = rate_limit_storage[client_ip]
-        
-        # Reset window if it has expired
-        if current_time - window_start >= self.window_size:
-            rate_limit_storage[client_ip] = (1, current_time)
-            return False
-        
-        # Check if limit exceeded
-        if request_count >= self.requests_per_minute:
-            return True
-        
-        # Increment request count
-        rate_limit_storage[client_ip] = (request_count + 1, window_start)
-        return False
-    
-    def _get_retry_after(self, client_ip: str) -> int:
-        """Get seconds until rate limit resets"""
-        _, window_start = rate_limit_storage[client_ip]
-        return int(self.window_size - (time.time() - window_start))
+    def _check_rate_limit(self, client_ip: str) -> RateLimitDecision:
+        """Count this request against the client's current fixed window"""
+        current_time = time.monotonic()
+        bucket = int(current_time // self.window_size)
+
+        prev_bucket, request_count = rate_limit_storage.pop(client_ip, (bucket, 0))
+        request_count = request_count + 1 if prev_bucket == bucket else 1
+
+        # Re-insert as most recently seen and evict the oldest client if over capacity
+        rate_limit_storage[client_ip] = (bucket, request_count)
+        if len(rate_limit_storage) > MAX_TRACKED_CLIENTS:
+            rate_limit_storage.popitem(last=False)
+
+        return RateLimitDecision(
+            limited=request_count > self.requests_per_minute,
+            retry_after=int((bucket + 1) * self.window_size - current_time)
+        )
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject request bodies over max_bytes before they are buffered
+    A declared Content-Length is checked up front; chunked bodies are counted
+    as they arrive and cut off as soon as they pass the limit
+    """
+
+    def __init__(self, app, max_bytes: int, max_size_mb: int):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.max_size_mb = max_size_mb
+
+    def _too_large_response(self) -> JSONResponse:
+        return JSONResponse(
+            status_code=413,
+            content={"detail": {
+                "response": f"Video file too large: exceeds maximum {self.max_size_mb}MB",
+                "code": 4002
+            }}
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Request(scope).headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            await self._too_large_response()(scope, receive, send)
+            return
+
+        received = 0
+        rejected = False
+
+        async def limited_receive():
+            nonlocal received, rejected
+            message = await receive()
+            if message["type"] == "http.request" and not rejected:
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Answer now and make the app see a client disconnect
+                    rejected = True
+                    await self._too_large_response()(scope, receive, send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message):
+            if not rejected:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            # The disconnect error raised inside the app after rejection
+            if not rejected:
+                raise
+
+
+class UnhandledErrorMiddleware:
+    """
+    Turn exceptions that escape the app into the generic 5000 error payload
+    Runs inside CORSMiddleware, unlike Starlette's Exception/500 handler
+    (ServerErrorMiddleware), so browsers see the JSON error and not a CORS failure
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def tracked_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, tracked_send)
+        except Exception:
+            if response_started:
+                # Too late to answer; let the server close the connection
+                raise
+            debug_logger.exception("Unhandled error on %s %s", scope.get("method"), scope.get("path"))
+            # Internal details stay in the log, not in the response
+            response = JSONResponse(
+                status_code=500,
+                content={"detail": {
+                    "response": "An unexpected error occurred",
+                    "code": 5000
+                }}
+            )
+            await response(scope, receive, send)
+
+
+def setup_error_middleware(app: FastAPI) -> None:
+    """Setup the catch-all error response for the FastAPI application"""
+    app.add_middleware(UnhandledErrorMiddleware) # type: ignore
+
+
+def setup_upload_size_middleware(app: FastAPI) -> None:
+    """Setup request body size limiting for the FastAPI application"""
+    app.add_middleware(
+        UploadSizeLimitMiddleware, # type: ignore
+        max_bytes=PROCTORING_CONFIG.MAX_VIDEO_SIZE_MB * 1024 * 1024 + UPLOAD_BODY_OVERHEAD_BYTES,
+        max_size_mb=PROCTORING_CONFIG.MAX_VIDEO_SIZE_MB
+    )
 
 def setup_rate_limit_middleware(app: FastAPI) -> None:
     """Setup rate limiting middleware for the FastAPI application"""
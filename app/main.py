@@ -12,56 +12,73 @@ parent_dir = str(Path(__file__).parent.parent)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from dotenv import load_dotenv
-load_dotenv()
+from app.core.config import load_env
+load_env()
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
 
 from app.utils.logger import debug_logger
-from app.core.config import ProctoringConfig, PROCTORING_DB_CONFIG
-from app.core.database import init_database, create_tables
+from app.core.config import PROCTORING_CONFIG, PROCTORING_DB_CONFIG
+from app.core.database import init_database, create_tables, verify_schema, dispose_database
+from app.core.dependencies import shutdown_process_pool
+from app.core.exceptions import AppError, STATUS_MAP
+from app.core.middlewares import setup_error_middleware, setup_upload_size_middleware
 from app.api.v1.router import api_router
 
-config = ProctoringConfig()
-
 # --------------------------------------------------
-# Lifespan Handler (Startup + Shutdown)
+# Lifespan Handlers (Startup + Shutdown)
 # --------------------------------------------------
 @asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifecycle management"""
-    # -------- Startup --------
-    debug_logger.info("AI Proctoring System v2.0 starting up...")
-    debug_logger.info(
-        f"CPU-optimized | FPS={config.TARGET_FPS} | "
-        f"Max Frame={config.MAX_FRAME_DIMENSION}px"
-    )
-
+async def _db_lifespan():
+    """
+    Database engine for the life of the worker
+    Table creation runs unless APP_RUN_MIGRATIONS=0; production runs it once
+    out-of-band so W workers don't race on DDL metadata locks at boot, and
+    workers then only check that the schema has been upgraded
+    """
     try:
-        # Initialize database and create tables
-        init_database(PROCTORING_DB_CONFIG)
-
-        # Import all models to register them with Base before creating tables
-        from app.models.proctoring import (
-            ProctoringReport,
-            ProctoringEventLog,
-            ProctoringEventSummary
-        )
-
-        create_tables()
+        await init_database(PROCTORING_DB_CONFIG)
+        if os.getenv("APP_RUN_MIGRATIONS", "1") == "1":
+            await create_tables(reset=os.getenv("APP_RESET_SCHEMA") == "1")
+        else:
+            await verify_schema()
         debug_logger.info("Database initialized with SQLAlchemy ORM")
-    except Exception as e:
+    except Exception:
         debug_logger.exception("Database initialization failed")
         raise
 
-    yield  # Application runs here
+    try:
+        yield
+    finally:
+        await dispose_database()
+
+
+@asynccontextmanager
+async def _process_pool_lifespan():
+    """Video process pool (started lazily on first use)"""
+    try:
+        yield
+    finally:
+        shutdown_process_pool()
+
 
-    # -------- Shutdown --------
-    debug_logger.info("AI Proctoring System shutting down...")
-    # Optional: close DB pools, cleanup temp files, etc.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifecycle management"""
+    debug_logger.info("AI Proctoring System v2.0 starting up...")
+    debug_logger.info(
+        f"CPU-optimized | FPS={PROCTORING_CONFIG.TARGET_FPS} | "
+        f"Max Frame={PROCTORING_CONFIG.MAX_FRAME_DIMENSION}px"
+    )
+
+    # Exited in reverse order: process pool first, then the database
+    async with _db_lifespan(), _process_pool_lifespan():
+        yield  # Application runs here
+        debug_logger.info("AI Proctoring System shutting down...")
 
 # --------------------------------------------------
 # FastAPI App
@@ -72,12 +89,16 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
 # --------------------------------------------------
 # Middleware
 # --------------------------------------------------
+# Added first so CORS wraps them: 413 and 500 responses still carry CORS headers
+setup_error_middleware(app)
+setup_upload_size_middleware(app)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -86,6 +107,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --------------------------------------------------
+# Exception Handlers
+# --------------------------------------------------
+@app.exception_handler(AppError)
+async def app_error_handler(request: Request, exc: AppError):
+    """Map application errors to their HTTP status in one place"""
+    return ORJSONResponse(
+        status_code=STATUS_MAP.get(type(exc), 500),
+        content={"detail": exc.detail},
+    )
+
 # --------------------------------------------------
 # Routes
 # --------------------------------------------------
@@ -96,10 +128,16 @@ app.include_router(api_router, prefix="/api/v1")
 # --------------------------------------------------
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "8001"))
+    # Each worker owns its own video process pool, so default to one worker
+    # and scale with WEB_CONCURRENCY (or gunicorn.conf.py) deliberately
     uvicorn.run(
-        "main:app",
+        "app.main:app",
         host=os.getenv("HOST", "0.0.0.0"),
         port=port,
         reload=False,
-        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        log_level=os.getenv("LOG_LEVEL", "warning"),
+        access_log=os.getenv("ACCESS_LOG", "false").lower() == "true",
     )
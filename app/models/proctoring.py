@@ -6,12 +6,39 @@ Creates the proctoring database schema:
 - proctoring_event_summary: Aggregated event summaries
 """
 
-from sqlalchemy import Column, String, DateTime, Float, Integer, Date, func, Index, ForeignKey
-from sqlalchemy.dialects.mysql import TEXT
-from datetime import datetime
+from sqlalchemy import BINARY, String, DateTime, Float, Integer, Date, func, Index, ForeignKey
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import date, datetime, timezone
+from typing import Optional
 import uuid as uuid_lib
 
 from app.core.database import Base
+from app.utils.ids import new_id
+
+
+def _utcnow() -> datetime:
+    """Naive UTC timestamp, matching the naive DateTime columns"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class BinaryUUID(TypeDecorator):
+    """
+    UUID stored as BINARY(16) instead of its 36-char text form.
+    Python code keeps passing and receiving canonical UUID strings.
+    """
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid_lib.UUID):
+            return value.bytes
+        return uuid_lib.UUID(value).bytes
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else str(uuid_lib.UUID(bytes=value))
 
 
 class ProctoringEventLog(Base):
@@ -22,28 +49,29 @@ class ProctoringEventLog(Base):
     """
     __tablename__ = 'proctoring_events_logs'
 
-    # Primary Key
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid_lib.uuid4()))
+    # Primary Key (internal, client-generated; 16 bytes in every secondary index)
+    id: Mapped[str] = mapped_column(BinaryUUID, primary_key=True, default=new_id)
 
-    # Foreign key to proctoring_reports (one report per interview)
-    interview_id = Column(String(36), ForeignKey('proctoring_reports.interview_id', ondelete='CASCADE'), nullable=False, index=True)
+    # Foreign key to proctoring_reports (one report per interview);
+    # indexed by the leading column of the composite index below
+    interview_id: Mapped[str] = mapped_column(String(36), ForeignKey('proctoring_reports.interview_id', ondelete='CASCADE'))
 
     # Event Data
-    event_type = Column(String(100), nullable=False, index=True)
-    event_timestamp = Column(DateTime, nullable=False, index=True)
+    event_type: Mapped[str] = mapped_column(String(100))
+    event_timestamp: Mapped[datetime] = mapped_column(DateTime, index=True)
 
     # Event Metrics
-    duration = Column(Float, nullable=True)
-    direction = Column(String(50), nullable=True)
-    intensity = Column(Float, nullable=True)
-    confidence = Column(Float, nullable=True)
+    duration: Mapped[Optional[float]] = mapped_column(Float)
+    direction: Mapped[Optional[str]] = mapped_column(String(50))
+    intensity: Mapped[Optional[float]] = mapped_column(Float)
+    confidence: Mapped[Optional[float]] = mapped_column(Float)
     # Stored as label (e.g. "slow", "moderate", "rapid") from analyzer output
-    velocity = Column(String(20), nullable=True)
+    velocity: Mapped[Optional[str]] = mapped_column(String(20))
     # Per-event risk classification (e.g. "normal", "suspicious", "high_risk")
-    event_risk = Column(String(20), nullable=True, index=True)
+    event_risk: Mapped[Optional[str]] = mapped_column(String(20), index=True)
 
     # Metadata
-    created_at = Column(DateTime, server_default=func.now(), index=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), index=True)
 
     __table_args__ = (
         Index('idx_interview_timestamp', 'interview_id', 'event_timestamp'),
@@ -56,14 +84,14 @@ class ProctoringEventLog(Base):
             'id': self.id,
             'interview_id': self.interview_id,
             'event_type': self.event_type,
-            'event_timestamp': self.event_timestamp.isoformat() if self.event_timestamp else None,
+            'event_timestamp': self.event_timestamp,
             'duration': self.duration,
             'direction': self.direction,
             'intensity': self.intensity,
             'confidence': self.confidence,
             'velocity': self.velocity,
             'event_risk': self.event_risk,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'created_at': self.created_at,
         }
 
 
@@ -76,18 +104,18 @@ class ProctoringReport(Base):
     __tablename__ = 'proctoring_reports'
 
     # Primary Key: one report per interview
-    interview_id = Column(String(36), primary_key=True)
+    interview_id: Mapped[str] = mapped_column(String(36), primary_key=True)
 
     # Report Data
-    interview_date = Column(Date, nullable=False, index=True)
-    cheating_likelihood_score = Column(Integer, nullable=False)
-    cheating_likelihood_level = Column(String(50), nullable=False, index=True)
+    interview_date: Mapped[date] = mapped_column(Date, index=True)
+    cheating_likelihood_score: Mapped[int] = mapped_column(Integer)
+    cheating_likelihood_level: Mapped[str] = mapped_column(String(50))
 
-    # Metadata
-    created_at = Column(DateTime, server_default=func.now(), index=True)
+    # Metadata: ORM inserts set UTC client-side, so a new instance has it
+    # loaded without a SELECT; server_default only covers non-ORM inserts
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=_utcnow, server_default=func.now(), index=True)
 
     __table_args__ = (
-        Index('idx_interview_created', 'interview_id', 'created_at'),
         Index('idx_risk_score', 'cheating_likelihood_score'),
         Index('idx_risk_level', 'cheating_likelihood_level'),
         {'mysql_engine': 'InnoDB', 'mysql_charset': 'utf8mb4'}
@@ -97,10 +125,10 @@ class ProctoringReport(Base):
         return {
             'id': self.interview_id,
             'interview_id': self.interview_id,
-            'interview_date': self.interview_date.isoformat() if self.interview_date else None,
+            'interview_date': self.interview_date,
             'cheating_likelihood_score': self.cheating_likelihood_score,
             'cheating_likelihood_level': self.cheating_likelihood_level,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'created_at': self.created_at,
         }
 
 
@@ -112,27 +140,28 @@ class ProctoringEventSummary(Base):
     """
     __tablename__ = 'proctoring_event_summary'
 
-    # Primary Key
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid_lib.uuid4()))
+    # Primary Key (internal, client-generated; 16 bytes in every secondary index)
+    id: Mapped[str] = mapped_column(BinaryUUID, primary_key=True, default=new_id)
 
-    # Foreign key to proctoring_reports (one report per interview)
-    interview_id = Column(String(36), ForeignKey('proctoring_reports.interview_id', ondelete='CASCADE'), nullable=False, index=True)
+    # Foreign key to proctoring_reports (one report per interview);
+    # indexed by the leading column of the composite index below
+    interview_id: Mapped[str] = mapped_column(String(36), ForeignKey('proctoring_reports.interview_id', ondelete='CASCADE'))
 
     # Summary Data
-    event_type = Column(String(100), nullable=False, index=True)
-    total_count = Column(Integer, nullable=False, default=0)
-    normal_count = Column(Integer, nullable=False, default=0)
-    suspicious_count = Column(Integer, nullable=False, default=0)
-    high_risk_count = Column(Integer, nullable=False, default=0)
+    event_type: Mapped[str] = mapped_column(String(100))
+    total_count: Mapped[int] = mapped_column(Integer, default=0)
+    normal_count: Mapped[int] = mapped_column(Integer, default=0)
+    suspicious_count: Mapped[int] = mapped_column(Integer, default=0)
+    high_risk_count: Mapped[int] = mapped_column(Integer, default=0)
 
     # Duration Metrics
-    total_duration = Column(Float, nullable=False, default=0.0)
+    total_duration: Mapped[float] = mapped_column(Float, default=0.0)
 
     # Correlation/Analysis
-    correlated_count = Column(Integer, nullable=False, default=0)
+    correlated_count: Mapped[int] = mapped_column(Integer, default=0)
 
     # Metadata
-    created_at = Column(DateTime, server_default=func.now(), index=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), index=True)
 
     __table_args__ = (
         Index('idx_interview_event_type', 'interview_id', 'event_type'),
@@ -151,6 +180,6 @@ class ProctoringEventSummary(Base):
             'high_risk_count': self.high_risk_count,
             'total_duration': self.total_duration,
             'correlated_count': self.correlated_count,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'created_at': self.created_at,
         }
 
@@ -4,10 +4,11 @@ Generic base repository interface with essential abstract methods
 """
 from app.utils.logger import debug_logger
 from abc import ABC, abstractmethod
-from typing import Optional, Generic, TypeVar, Type, Dict
-from sqlalchemy.orm import Session
+import logging
+from typing import Any, Optional, Generic, TypeVar, Type, Mapping
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import Base
+from app.core.database import Base, current_db_session
 
 # Generic type for SQLAlchemy models
 ModelType = TypeVar("ModelType", bound=Base)
@@ -20,23 +21,26 @@ class IRepository(ABC, Generic[ModelType]):
     """
 
     @abstractmethod
-    def get_configuration(self) -> Optional[Dict]:
+    def get_configuration(self) -> Optional[Mapping[str, Any]]:
         """
         Get configuration from database
         Returns configuration dictionary with all proctoring settings
         """
         pass
 
-    def get_report_by_session(self, session_id):
+    async def get_report_by_session(self, session_id):
         pass
 
-    def save_report(self, session_id, candidate_id, report_with_metadata, video_duration, fps):
+    async def save_report(self, session_id, candidate_id, report_with_metadata, video_duration, fps):
         pass
 
-    def get_reports_by_candidate(self, candidate_id, limit):
+    async def get_reports_by_candidate(self, candidate_id, limit):
         pass
 
-    def delete_report(self, session_id):
+    def stream_reports_by_candidate(self, candidate_id, limit):
+        pass
+
+    async def delete_report(self, session_id):
         pass
 
 
@@ -47,19 +51,29 @@ class BaseRepository(IRepository[ModelType]):
     Subclasses implement abstract methods with actual database logic
     """
 
-    def __init__(self, model: Type[ModelType], db: Session):
+    def __init__(self, model: Type[ModelType], db: Optional[AsyncSession] = None):
         """
         Initialize repository with model and database session
 
         Args:
             model: SQLAlchemy model class
-            db: Database session
+            db: Async database session; when omitted, the session bound to the
+                current request (current_db_session) is used on each access
         """
         self.model = model
-        self.db = db
-        debug_logger.debug(f"{self.__class__.__name__} initialized with model {model.__name__}")
+        self._db = db
+        if debug_logger.isEnabledFor(logging.DEBUG):
+            debug_logger.debug("%s initialized with model %s", self.__class__.__name__, model.__name__)
+
+    @property
+    def db(self) -> AsyncSession:
+        """Database session for the current operation"""
+        db = self._db or current_db_session.get()
+        if db is None:
+            raise RuntimeError("No database session bound. Resolve get_db_session first.")
+        return db
 
     @abstractmethod
-    def get_configuration(self) -> Optional[Dict]:
+    def get_configuration(self) -> Optional[Mapping[str, Any]]:
         """Get configuration from database - must be implemented in subclass"""
         pass
@@ -4,12 +4,16 @@ All database operations for proctoring reports using SQLAlchemy ORM
 Contains actual implementation of database logic
 """
 from app.utils.logger import debug_logger
-from typing import Optional, List, Dict
-import uuid
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Optional, List, Dict, Mapping
 from datetime import datetime, date
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.config import PROCTORING_DB_CONFIG
+from app.utils.ids import new_id
 from app.models.proctoring import (
     ProctoringReport,
     ProctoringEventLog,
@@ -19,6 +23,56 @@ from app.repositories.base_repository import BaseRepository
 
 logger = debug_logger
 
+# Columns for report reads, labelled like ProctoringReport.to_dict(). Selecting
+# them directly returns plain row mappings, skipping ORM instance construction
+# and identity-map bookkeeping for rows that are only serialized.
+REPORT_COLUMNS = (
+    ProctoringReport.interview_id.label("id"),
+    ProctoringReport.interview_id,
+    ProctoringReport.interview_date,
+    ProctoringReport.cheating_likelihood_score,
+    ProctoringReport.cheating_likelihood_level,
+    ProctoringReport.created_at,
+)
+
+# Default proctoring configuration until a proctoring_config table exists.
+# Read-only and built once, so every caller shares the same instance.
+DEFAULT_CONFIGURATION: Mapping[str, Any] = MappingProxyType({
+    'max_frame_dimension': 1280,
+    'target_fps': 12,
+    'calibration_duration_sec': 8.0,
+    'calibration_min_frames': 80,
+    'max_head_rotation_speed': 10.0,
+    'max_bbox_center_shift': 0.05,
+    'max_eye_angle_variance': 0.4,
+    'min_face_presence_score': 0.85,
+    'max_baseline_yaw': 20.0,
+    'max_baseline_pitch': 15.0,
+    'max_baseline_roll': 12.0,
+    'max_baseline_eye': 0.8,
+    'multiplier_eye': 2.0,
+    'multiplier_yaw': 1.6,
+    'multiplier_pitch': 1.4,
+    'multiplier_roll': 1.2,
+    'max_adaptive_eye': 1.4,
+    'max_adaptive_yaw': 35.0,
+    'max_adaptive_pitch': 30.0,
+    'max_adaptive_roll': 25.0,
+    'severity_suspicious_count_min': 15,
+    'severity_high_risk_count_min': 30,
+    'weight_gaze': 0.45,
+    'weight_head': 0.30,
+    'weight_face': 0.25,
+    'risk_clean_max': 0.20,
+    'risk_borderline_max': 0.40,
+    'risk_suspicious_max': 0.65,
+})
+
+# Loader options for queries returning ORM entities. With PROCTORING_STRICT_ORM=1
+# any lazy relationship access raises, so an N+1 pattern fails loudly in tests;
+# load relationships explicitly (selectinload) ahead of raiseload when needed.
+ENTITY_LOAD_OPTIONS = (raiseload("*"),) if PROCTORING_DB_CONFIG.STRICT_ORM else ()
+
 
 class ProctoringRepository(BaseRepository[ProctoringReport]):
     """
@@ -26,69 +80,37 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
     Handles all database CRUD operations using SQLAlchemy ORM
     Contains actual database logic implementation
     No abstract methods - only concrete implementations
+
+    Entity queries apply ENTITY_LOAD_OPTIONS. Relationships added to the models
+    must be declared with back_populates (not backref) so both sides are
+    visible where loader options are chosen.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Optional[AsyncSession] = None):
         """
         Initialize repository with database session
 
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session (None to use the request-bound session)
         """
         super().__init__(ProctoringReport, db)
         debug_logger.info("ProctoringRepository initialized")
 
-    def get_configuration(self) -> Optional[Dict]:
+    def get_configuration(self) -> Optional[Mapping[str, Any]]:
         """
         Get all proctoring configuration from database
         Fetches configuration data from proctoring_config table
 
         Returns:
-            Dict: Configuration dictionary with all proctoring settings
+            Mapping: Read-only configuration with all proctoring settings
             None: If configuration doesn't exist in database
         """
-        try:
-            # TODO: Query actual proctoring_config table when model is created
-            # For now, return default configuration structure
-            config = {
-                'max_frame_dimension': 1280,
-                'target_fps': 12,
-                'calibration_duration_sec': 8.0,
-                'calibration_min_frames': 80,
-                'max_head_rotation_speed': 10.0,
-                'max_bbox_center_shift': 0.05,
-                'max_eye_angle_variance': 0.4,
-                'min_face_presence_score': 0.85,
-                'max_baseline_yaw': 20.0,
-                'max_baseline_pitch': 15.0,
-                'max_baseline_roll': 12.0,
-                'max_baseline_eye': 0.8,
-                'multiplier_eye': 2.0,
-                'multiplier_yaw': 1.6,
-                'multiplier_pitch': 1.4,
-                'multiplier_roll': 1.2,
-                'max_adaptive_eye': 1.4,
-                'max_adaptive_yaw': 35.0,
-                'max_adaptive_pitch': 30.0,
-                'max_adaptive_roll': 25.0,
-                'severity_suspicious_count_min': 15,
-                'severity_high_risk_count_min': 30,
-                'weight_gaze': 0.45,
-                'weight_head': 0.30,
-                'weight_face': 0.25,
-                'risk_clean_max': 0.20,
-                'risk_borderline_max': 0.40,
-                'risk_suspicious_max': 0.65
-            }
-
-            debug_logger.info("Retrieved proctoring configuration from database")
-            return config
-
-        except SQLAlchemyError as e:
-            debug_logger.error(f"Database error retrieving configuration: {e}")
-            return None
+        # TODO: Query actual proctoring_config table when model is created,
+        # cached (lru_cache keyed on a config version) and invalidated on writes.
+        # For now, return the shared default configuration
+        return DEFAULT_CONFIGURATION
 
-    def create(self, obj: ProctoringReport) -> Optional[ProctoringReport]:
+    async def create(self, obj: ProctoringReport) -> Optional[ProctoringReport]:
         """
         Create a new proctoring report record in database
 
@@ -100,16 +122,35 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
         """
         try:
             self.db.add(obj)
-            self.db.commit()
-            self.db.refresh(obj)
-            debug_logger.info(f"Created ProctoringReport record: {obj.interview_id}")
+            await self.db.commit()
+            debug_logger.info("Created ProctoringReport record: %s", obj.interview_id)
             return obj
         except SQLAlchemyError as e:
-            self.db.rollback()
-            debug_logger.error(f"Failed to create ProctoringReport: {e}")
+            await self.db.rollback()
+            debug_logger.error("Failed to create ProctoringReport: %s", e)
             return None
 
-    def get_by_id(self, id: str) -> Optional[ProctoringReport]:
+    async def bulk_create(self, objs: List[ProctoringReport]) -> int:
+        """
+        Create many proctoring report records in one transaction
+
+        Args:
+            objs: ProctoringReport instances to create (primary keys set client-side)
+
+        Returns:
+            Number of records created (0 if failed)
+        """
+        try:
+            self.db.add_all(objs)
+            await self.db.commit()
+            debug_logger.info("Created %d ProctoringReport records", len(objs))
+            return len(objs)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            debug_logger.error("Failed to bulk create ProctoringReports: %s", e)
+            return 0
+
+    async def get_by_id(self, id: str) -> Optional[ProctoringReport]:
         """
         Get proctoring report by ID from database
 
@@ -120,12 +161,12 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
             ProctoringReport instance or None if not found
         """
         try:
-            return self.db.query(ProctoringReport).filter(ProctoringReport.interview_id == id).first()
+            return await self.db.get(ProctoringReport, id, options=ENTITY_LOAD_OPTIONS)
         except SQLAlchemyError as e:
-            debug_logger.error(f"Failed to get ProctoringReport by ID: {e}")
+            debug_logger.error("Failed to get ProctoringReport by ID: %s", e)
             return None
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[ProctoringReport]:
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[ProctoringReport]:
         """
         Get all proctoring reports with pagination from database
 
@@ -137,18 +178,19 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
             List of ProctoringReport instances
         """
         try:
-            return (
-                self.db.query(ProctoringReport)
+            result = await self.db.scalars(
+                select(ProctoringReport)
+                .options(*ENTITY_LOAD_OPTIONS)
                 .order_by(ProctoringReport.created_at.desc())
                 .limit(limit)
                 .offset(offset)
-                .all()
             )
+            return list(result)
         except SQLAlchemyError as e:
-            debug_logger.error(f"Failed to get all ProctoringReports: {e}")
+            debug_logger.error("Failed to get all ProctoringReports: %s", e)
             return []
 
-    def save_report(self, session_id: str, candidate_id: Optional[str],
+    async def save_report(self, session_id: str, candidate_id: Optional[str],
                     report: Dict, video_duration: float = 0.0, fps: float = 12.0) -> bool:
         """
         Save proctoring report to database (legacy method for backward compatibility)
@@ -169,7 +211,7 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
             interview_id = session_id
 
             # Save proctoring report
-            return self.save_proctoring_report(
+            return await self.save_proctoring_report(
                 interview_id=interview_id,
                 interview_date=date.today(),
                 cheating_likelihood_score=int(report.get('confidence_scores', {}).get('final_suspicion_score', 0) * 100),
@@ -177,10 +219,10 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
             )
 
         except Exception as e:
-            debug_logger.error(f"Failed to save report for session {session_id}: {e}")
+            debug_logger.error("Failed to save report for session %s: %s", session_id, e)
             return False
 
-    def get_report_by_session(self, session_id: str) -> Optional[Dict]:
+    async def get_report_by_session(self, session_id: str) -> Optional[Dict]:
         """
         Retrieve proctoring report by session ID from database
         Uses Interview session_id to find related reports
@@ -193,42 +235,64 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
         """
         try:
             # session_id is used as interview_id (one report per interview)
-            report = (
-                self.db.query(ProctoringReport)
-                .filter(ProctoringReport.interview_id == session_id)
-                .first()
-            )
+            report = (await self.db.execute(
+                select(*REPORT_COLUMNS)
+                .where(ProctoringReport.interview_id == session_id)
+            )).mappings().first()
 
             if report:
-                debug_logger.info(f"Retrieved report for session: {session_id}")
-                return report.to_dict()
+                debug_logger.info("Retrieved report for session: %s", session_id)
+                return dict(report)
 
-            debug_logger.warning(f"No report found for session: {session_id}")
+            debug_logger.warning("No report found for session: %s", session_id)
             return None
 
         except SQLAlchemyError as e:
-            debug_logger.error(f"Database error retrieving report for session {session_id}: {e}")
+            debug_logger.error("Database error retrieving report for session %s: %s", session_id, e)
             return None
 
-    def get_reports_by_candidate(self, candidate_id: str, limit: int = 10) -> List[Dict]:
+    async def get_reports_by_candidate(self, candidate_id: str, limit: int = 10) -> List[Dict]:
         """
         Retrieve all reports for a specific candidate from database.
         Without an Interview model, returns all reports up to limit (candidate_id ignored).
         """
         try:
-            reports = (
-                self.db.query(ProctoringReport)
+            reports = (await self.db.execute(
+                select(*REPORT_COLUMNS)
                 .order_by(ProctoringReport.created_at.desc())
                 .limit(limit)
-                .all()
-            )
-            debug_logger.info(f"Retrieved {len(reports)} reports for candidate: {candidate_id}")
-            return [report.to_dict() for report in reports]
+            )).mappings().all()
+            debug_logger.info("Retrieved %d reports for candidate: %s", len(reports), candidate_id)
+            return [dict(report) for report in reports]
         except SQLAlchemyError as e:
-            debug_logger.error(f"Database error retrieving reports for candidate {candidate_id}: {e}")
+            debug_logger.error("Database error retrieving reports for candidate %s: %s", candidate_id, e)
             return []
 
-    def delete_report(self, session_id: str) -> bool:
+    async def stream_reports_by_candidate(self, candidate_id: str, limit: int = 10) -> AsyncIterator[Dict]:
+        """
+        Stream reports for a candidate row by row from a server-side cursor.
+        Without an Interview model, streams all reports up to limit (candidate_id ignored).
+
+        Args:
+            candidate_id: Candidate identifier
+            limit: Maximum number of reports to stream
+
+        Yields:
+            Dict: Report data
+        """
+        try:
+            reports = await self.db.stream(
+                select(*REPORT_COLUMNS)
+                .order_by(ProctoringReport.created_at.desc())
+                .limit(limit)
+                .execution_options(yield_per=50)
+            )
+            async for report in reports.mappings():
+                yield dict(report)
+        except SQLAlchemyError as e:
+            debug_logger.error("Database error streaming reports for candidate %s: %s", candidate_id, e)
+
+    async def delete_report(self, session_id: str) -> bool:
         """
         Delete report by session ID from database (GDPR compliance)
 
@@ -240,26 +304,26 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
         """
         try:
             # session_id is used as interview_id for proctoring report lookup
-            rows_deleted = (
-                self.db.query(ProctoringReport)
-                .filter(ProctoringReport.interview_id == session_id)
-                .delete()
+            result = await self.db.execute(
+                delete(ProctoringReport)
+                .where(ProctoringReport.interview_id == session_id)
             )
-            self.db.commit()
+            await self.db.commit()
+            rows_deleted = result.rowcount
 
             if rows_deleted > 0:
-                debug_logger.info(f"Deleted {rows_deleted} report(s) for session: {session_id}")
+                debug_logger.info("Deleted %d report(s) for session: %s", rows_deleted, session_id)
                 return True
 
-            debug_logger.warning(f"No report found to delete for session: {session_id}")
+            debug_logger.warning("No report found to delete for session: %s", session_id)
             return False
 
         except SQLAlchemyError as e:
-            self.db.rollback()
-            debug_logger.error(f"Database error deleting report for session {session_id}: {e}")
+            await self.db.rollback()
+            debug_logger.error("Database error deleting report for session %s: %s", session_id, e)
             return False
 
-    def get_all_sessions(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+    async def get_all_sessions(self, limit: int = 100, offset: int = 0) -> List[Dict]:
         """
         Get all session reports with pagination from database
 
@@ -271,15 +335,20 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
             List[Dict]: List of session summaries
         """
         try:
-            reports = self.get_all(limit=limit, offset=offset)
-            debug_logger.info(f"Retrieved {len(reports)} session reports")
-            return [report.to_dict() for report in reports]
+            reports = (await self.db.execute(
+                select(*REPORT_COLUMNS)
+                .order_by(ProctoringReport.created_at.desc())
+                .limit(limit)
+                .offset(offset)
+            )).mappings().all()
+            debug_logger.info("Retrieved %d session reports", len(reports))
+            return [dict(report) for report in reports]
 
         except Exception as e:
-            debug_logger.error(f"Error retrieving all sessions: {e}")
+            debug_logger.error("Error retrieving all sessions: %s", e)
             return []
 
-    def get_reports_by_decision(self, decision: str, limit: int = 50) -> List[Dict]:
+    async def get_reports_by_decision(self, decision: str, limit: int = 50) -> List[Dict]:
         """
         Get reports filtered by final decision from database
 
@@ -291,26 +360,25 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
             List[Dict]: List of reports with specified decision
         """
         try:
-            reports = (
-                self.db.query(ProctoringReport)
-                .filter(ProctoringReport.cheating_likelihood_level == decision)
+            reports = (await self.db.execute(
+                select(*REPORT_COLUMNS)
+                .where(ProctoringReport.cheating_likelihood_level == decision)
                 .order_by(ProctoringReport.created_at.desc())
                 .limit(limit)
-                .all()
-            )
+            )).mappings().all()
 
-            debug_logger.info(f"Retrieved {len(reports)} reports with decision: {decision}")
-            return [report.to_dict() for report in reports]
+            debug_logger.info("Retrieved %d reports with decision: %s", len(reports), decision)
+            return [dict(report) for report in reports]
 
         except SQLAlchemyError as e:
-            debug_logger.error(f"Database error retrieving reports by decision {decision}: {e}")
+            debug_logger.error("Database error retrieving reports by decision %s: %s", decision, e)
             return []
 
     # ─────────────────────────────────────────────────────────────────────────────
     # EVENT LOG METHODS
     # ─────────────────────────────────────────────────────────────────────────────
 
-    def save_event_log(self, interview_id: str, event_type: str,
+    async def save_event_log(self, interview_id: str, event_type: str,
                        event_timestamp: datetime,
                        duration: Optional[float] = None,
                        direction: Optional[str] = None,
@@ -336,7 +404,7 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
         """
         try:
             event_log = ProctoringEventLog(
-                id=str(uuid.uuid4()),
+                id=new_id(),
                 interview_id=interview_id,
                 event_type=event_type,
                 event_timestamp=event_timestamp,
@@ -349,16 +417,69 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
             )
 
             self.db.add(event_log)
-            self.db.commit()
-            debug_logger.info(f"Created EventLog: {event_type} for interview {interview_id}")
+            await self.db.commit()
+            debug_logger.info("Created EventLog: %s for interview %s", event_type, interview_id)
             return True
 
         except SQLAlchemyError as e:
-            self.db.rollback()
-            debug_logger.error(f"Failed to save event log: {e}")
+            await self.db.rollback()
+            debug_logger.error("Failed to save event log: %s", e)
             return False
 
-    def save_event_summary(self, interview_id: str, event_type: str,
+    async def save_event_logs(self, event_logs: List[Dict]) -> int:
+        """
+        Save many event logs with one executemany INSERT and a single commit
+
+        Args:
+            event_logs: Column dictionaries as accepted by save_event_log
+                        (interview_id, event_type, event_timestamp, ...)
+
+        Returns:
+            int: Number of rows saved (0 if failed)
+        """
+        if not event_logs:
+            return 0
+        try:
+            await self.db.execute(
+                insert(ProctoringEventLog),
+                [{"id": new_id(), **event_log} for event_log in event_logs]
+            )
+            await self.db.commit()
+            debug_logger.info("Created %d EventLogs", len(event_logs))
+            return len(event_logs)
+
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            debug_logger.error("Failed to save event logs: %s", e)
+            return 0
+
+    async def save_event_summaries(self, summaries: List[Dict]) -> int:
+        """
+        Save many event summaries with one executemany INSERT and a single commit
+
+        Args:
+            summaries: Column dictionaries as accepted by save_event_summary
+
+        Returns:
+            int: Number of rows saved (0 if failed)
+        """
+        if not summaries:
+            return 0
+        try:
+            await self.db.execute(
+                insert(ProctoringEventSummary),
+                [{"id": new_id(), **summary} for summary in summaries]
+            )
+            await self.db.commit()
+            debug_logger.info("Created %d EventSummaries", len(summaries))
+            return len(summaries)
+
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            debug_logger.error("Failed to save event summaries: %s", e)
+            return 0
+
+    async def save_event_summary(self, interview_id: str, event_type: str,
                           total_count: int, normal_count: int,
                           suspicious_count: int, high_risk_count: int,
                           total_duration: float, correlated_count: int = 0) -> bool:
@@ -380,7 +501,7 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
         """
         try:
             summary = ProctoringEventSummary(
-                id=str(uuid.uuid4()),
+                id=new_id(),
                 interview_id=interview_id,
                 event_type=event_type,
                 total_count=total_count,
@@ -392,16 +513,16 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
             )
 
             self.db.add(summary)
-            self.db.commit()
-            debug_logger.info(f"Created EventSummary: {event_type} for interview {interview_id}")
+            await self.db.commit()
+            debug_logger.info("Created EventSummary: %s for interview %s", event_type, interview_id)
             return True
 
         except SQLAlchemyError as e:
-            self.db.rollback()
-            debug_logger.error(f"Failed to save event summary: {e}")
+            await self.db.rollback()
+            debug_logger.error("Failed to save event summary: %s", e)
             return False
 
-    def save_proctoring_report(self, interview_id: str, interview_date: date,
+    async def save_proctoring_report(self, interview_id: str, interview_date: date,
                               cheating_likelihood_score: int,
                               cheating_likelihood_level: str) -> bool:
         """
@@ -417,12 +538,12 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
             bool: True if successful, False otherwise
         """
         try:
-            existing = self.db.query(ProctoringReport).filter(ProctoringReport.interview_id == interview_id).first()
+            existing = await self.db.get(ProctoringReport, interview_id, options=ENTITY_LOAD_OPTIONS)
             if existing:
                 existing.interview_date = interview_date
                 existing.cheating_likelihood_score = cheating_likelihood_score
                 existing.cheating_likelihood_level = cheating_likelihood_level
-                self.db.commit()
+                await self.db.commit()
             else:
                 report = ProctoringReport(
                     interview_id=interview_id,
@@ -431,50 +552,45 @@ class ProctoringRepository(BaseRepository[ProctoringReport]):
                     cheating_likelihood_level=cheating_likelihood_level
                 )
                 self.db.add(report)
-                self.db.commit()
+                await self.db.commit()
             debug_logger.info(
-                f"Created ProctoringReport: {cheating_likelihood_level} ({cheating_likelihood_score}/100) "
-                f"for interview {interview_id}"
+                "Created ProctoringReport: %s (%s/100) for interview %s",
+                cheating_likelihood_level, cheating_likelihood_score, interview_id
             )
             return True
 
         except SQLAlchemyError as e:
-            self.db.rollback()
-            debug_logger.error(f"Failed to save proctoring report: {e}")
+            await self.db.rollback()
+            debug_logger.error("Failed to save proctoring report: %s", e)
             return False
 
-    def get_report_by_interview_id(self, interview_id: str) -> Optional[Dict]:
+    async def get_report_by_interview_id(self, interview_id: str) -> Optional[Dict]:
         """Get proctoring report for an interview"""
         try:
-            report = (
-                self.db.query(ProctoringReport)
-                .filter(ProctoringReport.interview_id == interview_id)
-                .order_by(ProctoringReport.created_at.desc())
-                .first()
-            )
+            report = await self.db.get(ProctoringReport, interview_id, options=ENTITY_LOAD_OPTIONS)
 
             if report:
                 return report.to_dict()
             return None
 
         except SQLAlchemyError as e:
-            debug_logger.error(f"Failed to get report for interview {interview_id}: {e}")
+            debug_logger.error("Failed to get report for interview %s: %s", interview_id, e)
             return None
 
-    def get_event_summaries(self, interview_id: str) -> List[Dict]:
+    async def get_event_summaries(self, interview_id: str) -> List[Dict]:
         """Get all event summaries for an interview"""
         try:
-            summaries = (
-                self.db.query(ProctoringEventSummary)
-                .filter(ProctoringEventSummary.interview_id == interview_id)
+            summaries = (await self.db.scalars(
+                select(ProctoringEventSummary)
+                .options(*ENTITY_LOAD_OPTIONS)
+                .where(ProctoringEventSummary.interview_id == interview_id)
                 .order_by(ProctoringEventSummary.event_type)
-                .all()
-            )
+            )).all()
 
             return [summary.to_dict() for summary in summaries]
 
         except SQLAlchemyError as e:
-            debug_logger.error(f"Failed to get event summaries for interview {interview_id}: {e}")
+            debug_logger.error("Failed to get event summaries for interview %s: %s", interview_id, e)
             return []
 
 
@@ -215,7 +215,7 @@ Pydantic models for AI Proctoring API
 Aligned with PDF Specification v1.0 + Industry Standard Enhancements
 """
 from typing import List, Optional, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -353,13 +353,15 @@ class ProcessVideoRequest(BaseModel):
     interview_id: Optional[str] = Field(None, description="Interview ID (UUID). If not provided, a new interview will be created.")
     video_url: Optional[str] = Field(None, description="URL to video file")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "interview_id": "550e8400-e29b-41d4-a716-446655440000",
                 "video_url": "https://example.com/video.mp4"
             }
         }
+    )
 
 
 class ProcessVideoResponse(BaseModel):
@@ -2,7 +2,7 @@
 Base service interfaces
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import AsyncIterator, Optional, Dict
 
 
 class IProctoringService(ABC):
@@ -19,21 +19,26 @@ class IProctoringService(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def process_video_file(self, video_path: str, interview_id: Optional[str] = None) -> Dict:
+    async def process_video_file(self, video_path: str, interview_id: Optional[str] = None) -> Dict:
         """Process video file and return report"""
         raise NotImplementedError
 
     @abstractmethod
-    def get_report(self, session_id: str) -> Optional[Dict]:
+    async def get_report(self, session_id: str) -> Optional[Dict]:
         """Get report by session ID"""
         raise NotImplementedError
 
     @abstractmethod
-    def get_candidate_reports(self, candidate_id: str, limit: int = 10) -> Dict:
+    async def get_candidate_reports(self, candidate_id: str, limit: int = 10) -> Dict:
         """Get all reports for a candidate"""
         raise NotImplementedError
 
     @abstractmethod
-    def delete_report(self, session_id: str) -> Dict:
+    def stream_candidate_reports(self, candidate_id: str, limit: int = 10) -> AsyncIterator[Dict]:
+        """Stream reports for a candidate one at a time"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_report(self, session_id: str) -> Dict:
         """Delete a report"""
         raise NotImplementedError
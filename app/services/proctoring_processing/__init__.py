@@ -1,17 +1,30 @@
 """
 Proctoring Service Package
 Contains all computation and business logic services
+
+Services are imported on first attribute access (PEP 562) so that importing
+the package does not pull in OpenCV / MediaPipe until a service is needed.
 """
+import importlib
+
+# Export all services: name -> defining submodule
+_LAZY = {
+    'VideoProcessingService': '.video_processing_service',
+    'DetectionService': '.detection_service',
+    'ScoringService': '.scoring_service',
+}
+
+__all__ = list(_LAZY)
+
 
-# Import active services
-from .video_processing_service import VideoProcessingService
-from .detection_service import DetectionService
-from .scoring_service import ScoringService
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = obj
+    return obj
 
-# Export all services
-__all__ = [
-    'VideoProcessingService',
-    'DetectionService',
-    'ScoringService',
-]
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,7 @@
 Base service for all proctoring processing services
 Provides common utilities and logging
 """
+import logging
 from abc import ABC, abstractmethod
 from typing import Dict
 from app.utils.logger import debug_logger
@@ -22,6 +23,9 @@ class BaseService(ABC):
         """
         self.config = config
         self.logger = debug_logger
+        # Level checks are resolved once; the helpers below then cost a bool test
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        self._info_enabled = self.logger.isEnabledFor(logging.INFO)
         self._setup()
 
     @abstractmethod
@@ -29,21 +33,23 @@ class BaseService(ABC):
         """Setup method to be implemented by subclasses"""
         pass
 
-    def log_info(self, message: str) -> None:
-        """Log info message"""
-        self.logger.info(message)
+    def log_info(self, message: str, *args) -> None:
+        """Log info message (%-style args are formatted only if emitted)"""
+        if self._info_enabled:
+            self.logger.info(message, *args)
 
-    def log_warning(self, message: str) -> None:
+    def log_warning(self, message: str, *args) -> None:
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def log_error(self, message: str) -> None:
+    def log_error(self, message: str, *args) -> None:
         """Log error message"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
-    def log_debug(self, message: str) -> None:
-        """Log debug message"""
-        self.logger.debug(message)
+    def log_debug(self, message: str, *args) -> None:
+        """Log debug message (%-style args are formatted only if emitted)"""
+        if self._debug_enabled:
+            self.logger.debug(message, *args)
 
     @abstractmethod
     def cleanup(self) -> None:
@@ -12,6 +12,7 @@ Additional accuracy improvements:
   - Occlusion fix: both spreads must be < 0.10 AND penalty reduced to 0.15
   - Velocity label now returns "slow" even below MIN_VELOCITY_THRESHOLD (no empty string)
 """
+import math
 import numpy as np
 import cv2
 from typing import Tuple, Optional, Dict, List, Any
@@ -21,6 +22,57 @@ from collections import deque
 
 from .base_proctoring_processing_service import BaseService
 
+# detect_gaze / detect_head_pose results for a frame without a face
+_NO_FACE_GAZE = (None, None, 0, None, 0.0, 0.0)
+_NO_FACE_POSE = (None, None, None, 0.0)
+
+
+def _landmark_array(landmarks) -> NDArray[np.float64]:
+    """Gather MediaPipe landmarks into an (N, 2) array of normalized x, y."""
+    n = len(landmarks)
+    return np.fromiter(
+        (c for lm in landmarks for c in (lm.x, lm.y)), dtype=np.float64, count=2 * n
+    ).reshape(n, 2)
+
+
+class _ScalarKalman:
+    """
+    Constant-velocity Kalman filter for one scalar signal.
+
+    Same model as ``cv2.KalmanFilter(2, 1)`` with transition [[1, 1], [0, 1]],
+    measurement [1, 0], process noise q*I and measurement noise r, written out
+    in scalars: the OpenCV binding costs far more than the ~20 flops per step.
+    State and covariance start at zero, as in OpenCV.
+    """
+    __slots__ = ('q', 'r', 'x', 'v', 'p00', 'p01', 'p11')
+
+    def __init__(self, q: float = 0.03, r: float = 0.1) -> None:
+        self.q = q
+        self.r = r
+        self.x = self.v = 0.0
+        self.p00 = self.p01 = self.p11 = 0.0
+
+    def step(self, z: float) -> float:
+        """Predict one step, correct with measurement ``z``; return the estimate."""
+        q = self.q
+        # predict: x = F x, P = F P F' + Q
+        x = self.x + self.v
+        v = self.v
+        p00 = self.p00 + 2.0 * self.p01 + self.p11 + q
+        p01 = self.p01 + self.p11
+        p11 = self.p11 + q
+        # correct
+        s  = p00 + self.r
+        k0 = p00 / s
+        k1 = p01 / s
+        y  = z - x
+        self.x = x + k0 * y
+        self.v = v + k1 * y
+        self.p00 = p00 - k0 * p00
+        self.p01 = p01 - k0 * p01
+        self.p11 = p11 - k1 * p01
+        return self.x
+
 
 class DetectionService(BaseService):
     """
@@ -40,27 +92,25 @@ class DetectionService(BaseService):
         """Initialize MediaPipe and detection models."""
         self.mp_face_mesh = mp.solutions.face_mesh
 
-        # max_num_faces=2 so multiple-face detection works for secondary face
-        self.gaze_face_mesh = self.mp_face_mesh.FaceMesh(
+        # max_num_faces=2 so multiple-face detection works for secondary face.
+        # One refined mesh serves gaze, head pose and TVT: the iris model adds
+        # landmarks 468-477 but the 6 pose landmarks are part of the base 468.
+        self.face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode=False,         # MediaPipe default, stated for clarity: track between frames
             max_num_faces=2,
             refine_landmarks=True,           # Enables iris tracking
             min_detection_confidence=0.60,
             min_tracking_confidence=0.60
         )
-        self.pose_face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=2,
-            refine_landmarks=False,          # Faster for head pose
-            min_detection_confidence=0.60,
-            min_tracking_confidence=0.60
-        )
 
-        # Eye landmarks (MediaPipe 468-landmark model)
-        self.LEFT_EYE         = [33, 133, 160, 159, 158, 144, 145, 153]
-        self.RIGHT_EYE        = [362, 263, 387, 386, 385, 373, 374, 380]
-        self.LEFT_IRIS        = [474, 475, 476, 477]
-        self.RIGHT_IRIS       = [469, 470, 471, 472]
-        self.LEFT_EYE_CORNERS  = [33, 133]
-        self.RIGHT_EYE_CORNERS = [362, 263]
+        # Eye landmarks (MediaPipe 468-landmark model), as index arrays so a
+        # whole group is gathered from the landmark array in one step
+        self.LEFT_EYE         = np.array([33, 133, 160, 159, 158, 144, 145, 153], dtype=np.intp)
+        self.RIGHT_EYE        = np.array([362, 263, 387, 386, 385, 373, 374, 380], dtype=np.intp)
+        self.LEFT_IRIS        = np.array([474, 475, 476, 477], dtype=np.intp)
+        self.RIGHT_IRIS       = np.array([469, 470, 471, 472], dtype=np.intp)
+        self.LEFT_EYE_CORNERS  = np.array([33, 133], dtype=np.intp)
+        self.RIGHT_EYE_CORNERS = np.array([362, 263], dtype=np.intp)
 
         # 6-point canonical 3-D face model (mm units, industry standard)
         self.landmark_indices = [1, 152, 33, 263, 61, 291]
@@ -73,10 +123,36 @@ class DetectionService(BaseService):
             (150.0,  -150.0, -125.0),    # Right mouth corner
         ], dtype=np.float64)
 
+        # FaceMesh returns normalised landmarks, so it can run on a smaller copy
+        # of the frame while all pixel maths keeps using the full-size frame
+        self._mesh_max_dim = getattr(self.config, 'MEDIAPIPE_INPUT_MAX_DIMENSION', 0)
+        # Downscale and RGB conversion targets, reused while the frame size stays the same
+        self._mesh_input_buffer: Optional[NDArray[np.uint8]] = None
+        self._rgb_buffer: Optional[NDArray[np.uint8]] = None
+
+        # Near-duplicate frame skipping (low-motion segments): landmarks of the
+        # last inferred frame are reused; gaze/pose maths still runs per frame
+        self._skip_duplicates = getattr(self.config, 'SKIP_DUPLICATE_FRAMES', False)
+        self._dup_max_diff    = getattr(self.config, 'DUPLICATE_FRAME_MAX_DIFF', 1.5)
+        self._dup_max_reuse   = getattr(self.config, 'DUPLICATE_FRAME_MAX_REUSE', 5)
+        self._last_thumb: Optional[NDArray[np.uint8]] = None
+        self._last_results = None
+        self._reuse_count = 0
+
+        # Pinhole intrinsics depend only on the frame size; built once per size
+        self._camera_matrix_cache: Dict[Tuple[int, int], NDArray[np.float64]] = {}
+        self._dist_coeffs = np.zeros((4, 1), dtype=np.float64)
+        # Last solvePnP pose, used to warm-start the iterative solver
+        self._prev_rvec: Optional[NDArray[np.float64]] = None
+        self._prev_tvec: Optional[NDArray[np.float64]] = None
+        self._rotation_matrix = np.empty((3, 3), dtype=np.float64)
+
         self._init_kalman_filters()
 
-        self.gaze_history: List[Tuple[float, float]] = []
-        self.max_history_size = 5   # Reduced for faster response to gaze shifts
+        # Weighted average over the last 3 smoothed readings, more weight on
+        # recent frames for faster response to gaze shifts
+        self.gaze_weights = (0.2, 0.3, 0.5)
+        self.gaze_history: deque = deque(maxlen=len(self.gaze_weights))
 
         self.yaw_history       = deque(maxlen=self.config.VELOCITY_HISTORY_SIZE)
         self.pitch_history     = deque(maxlen=self.config.VELOCITY_HISTORY_SIZE)
@@ -90,7 +166,9 @@ class DetectionService(BaseService):
         self._tvt_model: Optional[Any] = None
         self._last_tvt_prediction: Optional[Dict] = None
         self._last_tvt_time: float = 0.0
-        if getattr(self.config, 'ENABLE_TVT', False):
+        self._tvt_enabled: bool = getattr(self.config, 'ENABLE_TVT', False)
+        self._tvt_interval: float = getattr(self.config, 'TVT_INFERENCE_INTERVAL_SEC', 1.0)
+        if self._tvt_enabled:
             try:
                 from .temporal_buffer import TemporalBuffer
                 from .tvt_lite_model import create_tvt_model
@@ -107,46 +185,29 @@ class DetectionService(BaseService):
 
     def _init_kalman_filters(self) -> None:
         """Initialize Kalman filters for gaze smoothing."""
-        def _make_kf() -> cv2.KalmanFilter:
-            kf = cv2.KalmanFilter(2, 1)
-            kf.measurementMatrix = np.array([[1, 0]], np.float32)
-            kf.transitionMatrix  = np.array([[1, 1], [0, 1]], np.float32)
-            kf.processNoiseCov   = np.eye(2, dtype=np.float32) * 0.03
-            kf.measurementNoiseCov = np.array([[1]], np.float32) * 0.1
-            return kf
-
-        self.kf_horizontal = _make_kf()
-        self.kf_vertical   = _make_kf()
+        self.kf_horizontal = _ScalarKalman(q=0.03, r=0.1)
+        self.kf_vertical   = _ScalarKalman(q=0.03, r=0.1)
         self.kalman_initialized = False
 
     def _smooth_gaze_with_kalman(self, horizontal: float, vertical: float) -> Tuple[float, float]:
         """Apply Kalman filtering to smooth gaze measurements."""
-        try:
-            if not self.kalman_initialized:
-                self.kf_horizontal.statePre = np.array([[horizontal], [0]], np.float32)
-                self.kf_vertical.statePre   = np.array([[vertical],   [0]], np.float32)
-                self.kalman_initialized = True
-                return horizontal, vertical
-
-            self.kf_horizontal.predict()
-            self.kf_vertical.predict()
-            h_corr = self.kf_horizontal.correct(np.array([[horizontal]], np.float32))
-            v_corr = self.kf_vertical.correct(np.array([[vertical]],   np.float32))
-            return float(h_corr[0][0]), float(v_corr[0][0])
-        except Exception:
+        if not self.kalman_initialized:
+            # First reading passes through unsmoothed
+            self.kalman_initialized = True
             return horizontal, vertical
+        return self.kf_horizontal.step(horizontal), self.kf_vertical.step(vertical)
 
     # ------------------------------------------------------------------
     # Eye / iris helpers
     # ------------------------------------------------------------------
 
-    def _calculate_eye_aspect_ratio(self, eye_coords: List[List[float]]) -> float:
+    def _calculate_eye_aspect_ratio(self, eye_coords: NDArray[np.float64]) -> float:
         """Calculate Eye Aspect Ratio (EAR) for blink / eye-open detection."""
         try:
-            ea = np.array(eye_coords, dtype=np.float64)
-            v1  = np.linalg.norm(ea[1] - ea[5])
-            v2  = np.linalg.norm(ea[2] - ea[4])
-            h   = np.linalg.norm(ea[0] - ea[3])
+            ea = np.asarray(eye_coords, dtype=np.float64)
+            # v1 = |p1-p5|, v2 = |p2-p4|, h = |p0-p3| in one pass
+            d = ea[[1, 2, 0]] - ea[[5, 4, 3]]
+            v1, v2, h = np.sqrt((d * d).sum(axis=1))
             return float((v1 + v2) / (2.0 * h)) if h > 0 else 0.0
         except Exception:
             return 0.0
@@ -213,13 +274,15 @@ class DetectionService(BaseService):
     # Landmark vector for TVT (468 landmarks -> 936-dim vector)
     # ------------------------------------------------------------------
 
-    def get_landmark_vector(self, frame: NDArray[np.uint8]) -> Optional[NDArray[np.float32]]:
+    def get_landmark_vector(
+        self, frame: NDArray[np.uint8], results=None
+    ) -> Optional[NDArray[np.float32]]:
         """
         Extract 468 facial landmarks as flat vector [x1,y1,...,x468,y468].
         Uses normalized coords (0-1). Returns None if no face.
         """
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.gaze_face_mesh.process(rgb)
+        if results is None:
+            results = self.process_frame(frame)
         if results is None:
             return None
         mlm = getattr(results, 'multi_face_landmarks', None)
@@ -228,11 +291,8 @@ class DetectionService(BaseService):
         face_landmarks = mlm[0].landmark
         # Normalized x,y for each of 468 landmarks -> 936
         out = np.zeros(936, dtype=np.float32)
-        for i, lm in enumerate(face_landmarks):
-            if i >= 468:
-                break
-            out[i * 2] = lm.x
-            out[i * 2 + 1] = lm.y
+        pts = _landmark_array(face_landmarks[:468]).ravel()
+        out[:pts.size] = pts
         return out
 
     def push_landmark_and_maybe_run_tvt(
@@ -242,10 +302,9 @@ class DetectionService(BaseService):
         if self._tvt_buffer is None or self._tvt_model is None or landmark_vector is None:
             return
         self._tvt_buffer.push(landmark_vector, timestamp)
-        interval = getattr(self.config, 'TVT_INFERENCE_INTERVAL_SEC', 1.0)
         if not self._tvt_buffer.is_ready():
             return
-        if timestamp - self._last_tvt_time < interval:
+        if timestamp - self._last_tvt_time < self._tvt_interval:
             return
         window = self._tvt_buffer.get_window()
         if window is not None:
@@ -259,46 +318,94 @@ class DetectionService(BaseService):
         """Return latest TVT prediction or None if TVT disabled."""
         return self._last_tvt_prediction
 
+    # ------------------------------------------------------------------
+    # Face mesh inference (shared by gaze, head pose and TVT)
+    # ------------------------------------------------------------------
+
+    def process_frame(self, frame: NDArray[np.uint8]):
+        """
+        Run FaceMesh once on a BGR frame.
+
+        Pass the returned results to detect_gaze / detect_head_pose /
+        get_landmark_vector so a frame is converted and inferred only once.
+        """
+        thumb = None
+        if self._skip_duplicates:
+            thumb = cv2.resize(frame, (32, 32), interpolation=cv2.INTER_LINEAR)
+            if (
+                self._last_results is not None
+                and self._reuse_count < self._dup_max_reuse
+                and cv2.norm(thumb, self._last_thumb, cv2.NORM_L1) / thumb.size < self._dup_max_diff
+            ):
+                self._reuse_count += 1
+                return self._last_results
+
+        h, w = frame.shape[:2]
+        if 0 < self._mesh_max_dim < max(h, w):
+            scale = self._mesh_max_dim / max(h, w)
+            size = (round(w * scale), round(h * scale))
+            small = self._mesh_input_buffer
+            if small is None or small.shape[1::-1] != size:
+                small = self._mesh_input_buffer = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            frame = cv2.resize(frame, size, dst=small, interpolation=cv2.INTER_LINEAR)
+        rgb = self._rgb_buffer
+        if rgb is None or rgb.shape != frame.shape:
+            rgb = self._rgb_buffer = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+        results = self.face_mesh.process(rgb)
+
+        if thumb is not None:
+            # Only frames with a face are reused, so face loss is never masked
+            has_face = bool(getattr(results, 'multi_face_landmarks', None))
+            self._last_results = results if has_face else None
+            self._last_thumb   = thumb
+            self._reuse_count  = 0
+        return results
+
     # ------------------------------------------------------------------
     # Gaze detection
     # ------------------------------------------------------------------
 
     def detect_gaze(
-        self, frame: NDArray[np.uint8]
+        self, frame: NDArray[np.uint8], results=None
     ) -> Tuple[Optional[float], Optional[float], int, Optional[Tuple[float, float]], float, float]:
         """
         Detect gaze angles with enhanced iris tracking and Kalman smoothing.
 
+        ``results`` is the output of process_frame for this frame; when
+        omitted the frame is processed here.
+
         Returns
         -------
         (horizontal_angle, vertical_angle, num_faces, bbox_center,
          gaze_confidence, occlusion_ratio)
         """
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.gaze_face_mesh.process(rgb)
+        if results is None:
+            results = self.process_frame(frame)
 
         if results is None:
-            return None, None, 0, None, 0.0, 0.0
+            return _NO_FACE_GAZE
 
         mlm = getattr(results, 'multi_face_landmarks', None)
         if not mlm:
-            return None, None, 0, None, 0.0, 0.0
+            return _NO_FACE_GAZE
 
         num_faces = len(mlm)
         face_landmarks = mlm[0].landmark
         h, w = frame.shape[:2]
 
-        x_coords = [lm.x * w for lm in face_landmarks]
-        y_coords = [lm.y * h for lm in face_landmarks]
-        bbox_center = (float(np.mean(x_coords)), float(np.mean(y_coords)))
+        # All landmarks in pixel coordinates, gathered once per frame
+        pts = _landmark_array(face_landmarks) * (w, h)
+        cx, cy = pts.mean(axis=0)
+        bbox_center = (float(cx), float(cy))
 
         occlusion_ratio, _ = self._calculate_face_occlusion(face_landmarks)
 
         try:
-            le_coords = [[face_landmarks[i].x * w, face_landmarks[i].y * h] for i in self.LEFT_EYE]
-            re_coords = [[face_landmarks[i].x * w, face_landmarks[i].y * h] for i in self.RIGHT_EYE]
-            li_coords = [[face_landmarks[i].x * w, face_landmarks[i].y * h] for i in self.LEFT_IRIS]
-            ri_coords = [[face_landmarks[i].x * w, face_landmarks[i].y * h] for i in self.RIGHT_IRIS]
+            le_coords = pts[self.LEFT_EYE]
+            re_coords = pts[self.RIGHT_EYE]
+            li_coords = pts[self.LEFT_IRIS]
+            ri_coords = pts[self.RIGHT_IRIS]
 
             l_ear = self._calculate_eye_aspect_ratio(le_coords)
             r_ear = self._calculate_eye_aspect_ratio(re_coords)
@@ -308,22 +415,23 @@ class DetectionService(BaseService):
             if avg_ear < 0.12:
                 return None, None, num_faces, bbox_center, 0.0, occlusion_ratio
 
-            iris_valid = (
-                all(0 <= c[0] <= w and 0 <= c[1] <= h for c in li_coords) and
-                all(0 <= c[0] <= w and 0 <= c[1] <= h for c in ri_coords)
+            # Every iris landmark must lie inside the frame
+            frame_max = (w, h)
+            iris_valid = bool(
+                ((li_coords >= 0) & (li_coords <= frame_max)).all() and
+                ((ri_coords >= 0) & (ri_coords <= frame_max)).all()
             )
             if not iris_valid:
                 return None, None, num_faces, bbox_center, 0.0, occlusion_ratio
 
-            le_center = np.mean(np.array(le_coords, dtype=np.float64), axis=0)
-            re_center = np.mean(np.array(re_coords, dtype=np.float64), axis=0)
-            li_center = np.mean(np.array(li_coords, dtype=np.float64), axis=0)
-            ri_center = np.mean(np.array(ri_coords, dtype=np.float64), axis=0)
+            le_center = le_coords.mean(axis=0)
+            re_center = re_coords.mean(axis=0)
+            li_center = li_coords.mean(axis=0)
+            ri_center = ri_coords.mean(axis=0)
 
-            def _eye_width(corners: List[int]) -> float:
-                p1 = np.array([face_landmarks[corners[0]].x * w, face_landmarks[corners[0]].y * h])
-                p2 = np.array([face_landmarks[corners[1]].x * w, face_landmarks[corners[1]].y * h])
-                return float(np.linalg.norm(p2 - p1))
+            def _eye_width(corners: NDArray[np.intp]) -> float:
+                dx, dy = pts[corners[1]] - pts[corners[0]]
+                return math.hypot(dx, dy)
 
             avg_eye_width = (_eye_width(self.LEFT_EYE_CORNERS) + _eye_width(self.RIGHT_EYE_CORNERS)) / 2.0
             if avg_eye_width < 1.8:
@@ -331,24 +439,23 @@ class DetectionService(BaseService):
 
             avg_disp = ((li_center - le_center) + (ri_center - re_center)) / 2.0
 
-            h_ratio = float(np.clip(avg_disp[0] / avg_eye_width, -1.0, 1.0))
-            v_ratio = float(np.clip(avg_disp[1] / avg_eye_width, -1.0, 1.0))
+            h_ratio = max(-1.0, min(1.0, float(avg_disp[0]) / avg_eye_width))
+            v_ratio = max(-1.0, min(1.0, float(avg_disp[1]) / avg_eye_width))
 
-            h_angle = float(np.arcsin(h_ratio * 0.9) * (180.0 / np.pi))
-            v_angle = float(np.arcsin(v_ratio * 0.9) * (180.0 / np.pi))
+            h_angle = math.degrees(math.asin(h_ratio * 0.9))
+            v_angle = math.degrees(math.asin(v_ratio * 0.9))
 
             h_angle, v_angle = self._smooth_gaze_with_kalman(h_angle, v_angle)
 
-            self.gaze_history.append((h_angle, v_angle))
-            if len(self.gaze_history) > self.max_history_size:
-                self.gaze_history.pop(0)
+            history = self.gaze_history
+            history.append((h_angle, v_angle))
 
             # Weighted average: more weight on recent frames for faster response
-            if len(self.gaze_history) >= 3:
-                wts = np.array([0.2, 0.3, 0.5])
-                recent = self.gaze_history[-3:]
-                h_angle = float(np.average([x[0] for x in recent], weights=wts))
-                v_angle = float(np.average([x[1] for x in recent], weights=wts))
+            if len(history) == history.maxlen:
+                (h0, v0), (h1, v1), (h2, v2) = history
+                w0, w1, w2 = self.gaze_weights
+                h_angle = w0 * h0 + w1 * h1 + w2 * h2
+                v_angle = w0 * v0 + w1 * v1 + w2 * v2
 
             gaze_conf = self._calculate_gaze_confidence(avg_ear, iris_valid, avg_eye_width)
             return round(h_angle, 2), round(v_angle, 2), num_faces, bbox_center, gaze_conf, occlusion_ratio
@@ -373,53 +480,69 @@ class DetectionService(BaseService):
         """
         mlm = getattr(results, 'multi_face_landmarks', None)
         if not mlm:
+            self._prev_rvec = self._prev_tvec = None
             return None, None, None, 0.0
 
         face_landmarks = mlm[0].landmark
         h, w = frame.shape[:2]
 
-        image_points = np.array(
-            [[face_landmarks[i].x * w, face_landmarks[i].y * h] for i in self.landmark_indices],
-            dtype=np.float64
-        )
-
-        focal_length  = float(w)
-        camera_matrix = np.array(
-            [[focal_length, 0, w / 2.0],
-             [0, focal_length, h / 2.0],
-             [0, 0, 1]],
-            dtype=np.float64
-        )
-        dist_coeffs = np.zeros((4, 1), dtype=np.float64)
+        pose_points  = _landmark_array([face_landmarks[i] for i in self.landmark_indices])
+        image_points = pose_points * (w, h)
+
+        camera_matrix = self._camera_matrix_cache.get((w, h))
+        if camera_matrix is None:
+            focal_length  = float(w)
+            camera_matrix = np.array(
+                [[focal_length, 0, w / 2.0],
+                 [0, focal_length, h / 2.0],
+                 [0, 0, 1]],
+                dtype=np.float64
+            )
+            self._camera_matrix_cache[(w, h)] = camera_matrix
 
         try:
-            success, rvec, _ = cv2.solvePnP(
-                self.model_points, image_points,
-                camera_matrix, dist_coeffs,
-                flags=cv2.SOLVEPNP_ITERATIVE
-            )
+            # Consecutive frames differ little, so starting LM from the previous
+            # pose converges in a few iterations instead of a full DLT init
+            if self._prev_rvec is not None:
+                success, rvec, tvec = cv2.solvePnP(
+                    self.model_points, image_points,
+                    camera_matrix, self._dist_coeffs,
+                    self._prev_rvec.copy(), self._prev_tvec.copy(),
+                    useExtrinsicGuess=True,
+                    flags=cv2.SOLVEPNP_ITERATIVE
+                )
+            else:
+                success, rvec, tvec = cv2.solvePnP(
+                    self.model_points, image_points,
+                    camera_matrix, self._dist_coeffs,
+                    flags=cv2.SOLVEPNP_ITERATIVE
+                )
             if not success or rvec is None:
+                self._prev_rvec = self._prev_tvec = None
                 return None, None, None, 0.0
+            self._prev_rvec, self._prev_tvec = rvec, tvec
 
-            r, _ = cv2.Rodrigues(rvec)
+            r, _ = cv2.Rodrigues(rvec, self._rotation_matrix)
             if r is None:
                 return None, None, None, 0.0
 
-            sy        = float(np.sqrt(r[0, 0] ** 2 + r[1, 0] ** 2))
+            # Euler extraction on plain floats (scalar NumPy calls cost more than the maths)
+            (r00, _, _), (r10, r11, r12), (r20, r21, r22) = r.tolist()
+            sy        = math.sqrt(r00 * r00 + r10 * r10)
             singular  = sy < 1e-6
 
             if not singular:
-                pitch_rad = np.arctan2(r[2, 1], r[2, 2])
-                yaw_rad   = np.arctan2(-r[2, 0], sy)
-                roll_rad  = np.arctan2(r[1, 0], r[0, 0])
+                pitch_rad = math.atan2(r21, r22)
+                yaw_rad   = math.atan2(-r20, sy)
+                roll_rad  = math.atan2(r10, r00)
             else:
-                pitch_rad = np.arctan2(-r[1, 2], r[1, 1])
-                yaw_rad   = np.arctan2(-r[2, 0], sy)
+                pitch_rad = math.atan2(-r12, r11)
+                yaw_rad   = math.atan2(-r20, sy)
                 roll_rad  = 0.0
 
-            yaw_deg   = float(np.degrees(yaw_rad))
-            pitch_deg = float(np.degrees(pitch_rad))
-            roll_deg  = float(np.degrees(roll_rad))
+            yaw_deg   = math.degrees(yaw_rad)
+            pitch_deg = math.degrees(pitch_rad)
+            roll_deg  = math.degrees(roll_rad)
 
             # ── BUG-1 FIX ──────────────────────────────────────────────────────
             # solvePnP + Rodrigues can return pitch near ±180° for a normally
@@ -432,10 +555,7 @@ class DetectionService(BaseService):
             # ───────────────────────────────────────────────────────────────────
 
             # Confidence: based on landmark spread and solvePnP conditioning
-            x_coords = [face_landmarks[i].x for i in self.landmark_indices]
-            y_coords = [face_landmarks[i].y for i in self.landmark_indices]
-            x_spread = max(x_coords) - min(x_coords)
-            y_spread = max(y_coords) - min(y_coords)
+            x_spread, y_spread = np.ptp(pose_points, axis=0)
 
             lm_conf = 1.0 if (x_spread >= 0.15 and y_spread >= 0.15) else 0.70
             sy_conf = 0.95 if sy > 0.2 else (0.80 if sy > 0.1 else 0.60)
@@ -448,18 +568,44 @@ class DetectionService(BaseService):
             )
 
         except (cv2.error, ValueError, TypeError):
+            self._prev_rvec = self._prev_tvec = None
             return None, None, None, 0.0
 
     def detect_head_pose(
-        self, frame: NDArray[np.uint8]
+        self, frame: NDArray[np.uint8], results=None
     ) -> Tuple[Optional[float], Optional[float], Optional[float], float]:
         """Detect head pose angles (yaw, pitch, roll) + confidence."""
-        rgb     = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.pose_face_mesh.process(rgb)
         if results is None:
-            return None, None, None, 0.0
+            results = self.process_frame(frame)
+        if results is None:
+            return _NO_FACE_POSE
         return self._estimate_head_pose(frame, results)
 
+    def detect_all(
+        self, frame: NDArray[np.uint8], with_landmarks: bool = False
+    ) -> Tuple[Tuple, Tuple, Optional[NDArray[np.float32]]]:
+        """
+        Gaze, head pose and (optionally) the TVT landmark vector from a single
+        FaceMesh pass. Frames without a face skip the per-detector work.
+
+        Returns
+        -------
+        (gaze, pose, landmark_vector) — gaze and pose as returned by
+        detect_gaze and detect_head_pose.
+        """
+        results = self.process_frame(frame)
+        if results is None:
+            return _NO_FACE_GAZE, _NO_FACE_POSE, None
+        if not getattr(results, 'multi_face_landmarks', None):
+            # Same side effect as _estimate_head_pose on a missing face
+            self._prev_rvec = self._prev_tvec = None
+            return _NO_FACE_GAZE, _NO_FACE_POSE, None
+
+        gaze = self.detect_gaze(frame, results)
+        pose = self._estimate_head_pose(frame, results)
+        landmark_vector = self.get_landmark_vector(frame, results) if with_landmarks else None
+        return gaze, pose, landmark_vector
+
     # ------------------------------------------------------------------
     # Violation update (public entry point called per frame)
     # ------------------------------------------------------------------
@@ -483,9 +629,10 @@ class DetectionService(BaseService):
         _ = roll  # reserved for future roll-based detection
 
         # TVT: push landmarks and run inference when interval elapsed
-        if getattr(self.config, 'ENABLE_TVT', False) and landmark_vector is not None:
+        tvt_enabled = self._tvt_enabled
+        if tvt_enabled and landmark_vector is not None:
             self.push_landmark_and_maybe_run_tvt(landmark_vector, timestamp)
-        tvt_prediction = self.get_tvt_prediction() if getattr(self.config, 'ENABLE_TVT', False) else None
+        tvt_prediction = self.get_tvt_prediction() if tvt_enabled else None
 
         self.timestamp_history.append(timestamp)
         if yaw   is not None: self.yaw_history.append(yaw)
@@ -522,12 +669,35 @@ class DetectionService(BaseService):
     # Cleanup
     # ------------------------------------------------------------------
 
+    def reset(self) -> None:
+        """
+        Clear all per-video state so the loaded FaceMesh graph can be reused
+        for another video; cheaper than building a new DetectionService.
+        """
+        self.face_mesh.reset()
+        self._init_kalman_filters()
+        self.gaze_history.clear()
+        self.yaw_history.clear()
+        self.pitch_history.clear()
+        self.eye_angle_history.clear()
+        self.timestamp_history.clear()
+        self._prev_rvec = self._prev_tvec = None
+        self._last_thumb = self._last_results = None
+        self._reuse_count = 0
+        if self._tvt_buffer is not None:
+            self._tvt_buffer.clear()
+        self._last_tvt_prediction = None
+        self._last_tvt_time = 0.0
+        self.violation_tracker = ViolationTracker(self.config)
+
     def cleanup(self) -> None:
         """Release MediaPipe resources and finalise active violations."""
-        for attr in ('gaze_face_mesh', 'pose_face_mesh'):
-            if hasattr(self, attr):
-                getattr(self, attr).close()
+        if hasattr(self, 'face_mesh'):
+            self.face_mesh.close()
         self.gaze_history.clear()
+        self._prev_rvec = self._prev_tvec = None
+        self._mesh_input_buffer = self._rgb_buffer = None
+        self._last_thumb = self._last_results = None
         if getattr(self, '_tvt_buffer', None) is not None:
             self._tvt_buffer.clear()
         self.violation_tracker.finalize()
@@ -537,6 +707,78 @@ class DetectionService(BaseService):
 # ViolationTracker
 # ======================================================================
 
+class _AxisState:
+    """
+    Open-event state for one head / eye axis.
+
+    Plain slotted attributes instead of a dict: the axis state machines touch
+    these fields several times per frame.
+    """
+    __slots__ = (
+        'active', 'start_time', 'last_update_time', 'direction',
+        'max_intensity', 'confidence', 'velocity',
+    )
+
+    def __init__(self) -> None:
+        self.active           = False
+        self.start_time       = 0.0
+        self.last_update_time = 0.0
+        self.direction        = ''
+        self.max_intensity    = 0.0
+        self.confidence       = 0.0
+        self.velocity         = 0.0
+
+    def start(
+        self, timestamp: float, direction: str,
+        intensity: float, confidence: float, velocity: float,
+    ) -> None:
+        """Open a new event at ``timestamp``."""
+        self.active           = True
+        self.start_time       = timestamp
+        self.last_update_time = timestamp
+        self.direction        = direction
+        self.max_intensity    = intensity
+        self.confidence       = confidence
+        self.velocity         = velocity
+
+    def extend(
+        self, timestamp: float, intensity: float, confidence: float, velocity: float,
+    ) -> None:
+        """Continue the open event, keeping the peak values."""
+        self.last_update_time = timestamp
+        if intensity > self.max_intensity:
+            self.max_intensity = intensity
+        if confidence > self.confidence:
+            self.confidence = confidence
+        if velocity > self.velocity:
+            self.velocity = velocity
+
+
+class _SpanState:
+    """
+    Open-event state for face missing / face occluded / multiple faces.
+
+    ``peak`` keeps the largest occlusion ratio or face count seen during the
+    event; ``pending_since`` is when face loss was first seen, before the
+    face_missing event is confirmed.
+    """
+    __slots__ = ('active', 'start_time', 'last_update_time', 'peak', 'pending_since')
+
+    def __init__(self) -> None:
+        self.active           = False
+        self.start_time       = 0.0
+        self.last_update_time = 0.0
+        self.peak             = 0.0
+        self.pending_since: Optional[float] = None
+
+    def start(self, start_time: float, timestamp: float, peak: float = 0.0) -> None:
+        """Open an event that began at ``start_time`` and was last seen at ``timestamp``."""
+        self.active           = True
+        self.start_time       = start_time
+        self.last_update_time = timestamp
+        self.peak             = peak
+
+
 class ViolationTracker:
     """
     Duration-based violation tracker.
@@ -581,6 +823,25 @@ class ViolationTracker:
         # Tightened from 0.5 → 0.3 s so fast look-aways are not missed
         self.gap_tolerance = getattr(config, 'EVENT_GAP_TOLERANCE', 0.3)
 
+        # Thresholds read on every frame / event, resolved once (config is frozen)
+        self.min_event_duration    = getattr(config, 'MIN_EVENT_DURATION', 0.5)
+        self.min_confidence        = getattr(config, 'MIN_CONFIDENCE_THRESHOLD', 0.45)
+        face_missing_min           = getattr(config, 'FACE_MISSING_MIN_DURATION', None)
+        self.face_missing_min_duration = (
+            self.min_event_duration if face_missing_min is None else face_missing_min
+        )
+        self.face_missing_min_start    = getattr(config, 'FACE_MISSING_MIN_START_DURATION', 0.0)
+        self.min_multiple_face_duration = getattr(config, 'MIN_MULTIPLE_FACE_DURATION', 0.3)
+        self.face_occlusion_threshold  = getattr(config, 'FACE_OCCLUSION_THRESHOLD', 0.30)
+        self.head_turn_bridge          = getattr(config, 'HEAD_TURN_BRIDGE_SECONDS', 1.0)
+        self.tvt_prob_threshold        = getattr(config, 'TVT_PROB_THRESHOLD', 0.85)
+        self.safe_down_max_velocity    = getattr(config, 'SAFE_DOWN_MAX_VELOCITY_DEG_PER_S', 10.0)
+        self.safe_down_max_duration    = getattr(config, 'SAFE_DOWN_MAX_DURATION_SEC', 5.0)
+        self.safe_down_max_pitch       = getattr(config, 'SAFE_DOWN_MAX_PITCH_DEG', 25.0)
+        self.min_velocity         = config.MIN_VELOCITY_THRESHOLD
+        self.suspicious_velocity  = config.SUSPICIOUS_VELOCITY_THRESHOLD
+        self.high_risk_velocity   = config.HIGH_RISK_VELOCITY_THRESHOLD
+
         # ── Head-turn bridge (BUG-8 FIX) ─────────────────────────────────────
         # When an extreme head turn causes MediaPipe to lose the face (num_faces=0),
         # the system was incorrectly opening a face_missing event.  We track the
@@ -590,38 +851,17 @@ class ViolationTracker:
 
         # ── Per-type state machines ──────────────────────────────────────────
         # Head: tracked separately for yaw axis and pitch axis
-        _head_default = {
-            'active': False, 'start_time': 0.0, 'last_update_time': 0.0,
-            'direction': '', 'max_intensity': 0.0,
-            'confidence': 0.0, 'velocity': 0.0,
-        }
-        self.current_yaw_state   = dict(_head_default)
-        self.current_pitch_state = dict(_head_default)
+        self.current_yaw_state   = _AxisState()
+        self.current_pitch_state = _AxisState()
 
         # Eye: tracked separately for horizontal (left/right) and vertical (up/down), like head yaw/pitch
-        self.current_eye_state: Dict = {
-            'active': False, 'start_time': 0.0, 'last_update_time': 0.0,
-            'direction': '', 'max_intensity': 0.0,
-            'confidence': 0.0, 'velocity': 0.0,
-        }
-        self.current_eye_h_state: Dict = dict(self.current_eye_state)
-        self.current_eye_v_state: Dict = dict(self.current_eye_state)
-        # first_no_face_time: when we first saw num_faces==0; active only after min_start_duration
-        self.current_face_missing_state: Dict = {
-            'active': False, 'start_time': 0.0, 'last_update_time': 0.0,
-            'first_no_face_time': None,
-        }
-        self.current_face_occluded_state: Dict = {
-            'active': False, 'start_time': 0.0, 'last_update_time': 0.0,
-            'max_occlusion': 0.0,
-        }
-        # multiple_faces reuses the generic active_violations dict
-        self.active_violations: Dict[str, Dict] = {
-            'multiple_faces': {
-                'active': False, 'start_time': 0.0, 'last_update_time': 0.0,
-                'duration': 0.0, 'max_intensity': 0.0, 'confidence': 0.9, 'velocity': 0.0,
-            }
-        }
+        self.current_eye_state   = _AxisState()
+        self.current_eye_h_state = _AxisState()
+        self.current_eye_v_state = _AxisState()
+        # face_missing: pending_since is when we first saw num_faces==0; active only after min_start_duration
+        self.current_face_missing_state  = _SpanState()
+        self.current_face_occluded_state = _SpanState()   # peak = max occlusion ratio
+        self.current_multiple_faces_state = _SpanState()  # peak = max face count
 
     # ------------------------------------------------------------------
     # Velocity helpers
@@ -655,11 +895,11 @@ class ViolationTracker:
         BUG-2 FIX: Previously returned "" for velocity < MIN_VELOCITY_THRESHOLD,
         leaving events without any label.  Now always returns a non-empty string.
         """
-        if velocity < self.config.MIN_VELOCITY_THRESHOLD:
+        if velocity < self.min_velocity:
             return "negligible"           # was "" — now always labelled
-        elif velocity < self.config.SUSPICIOUS_VELOCITY_THRESHOLD:
+        elif velocity < self.suspicious_velocity:
             return "slow"
-        elif velocity < self.config.HIGH_RISK_VELOCITY_THRESHOLD:
+        elif velocity < self.high_risk_velocity:
             return "moderate"
         else:
             return "rapid"
@@ -681,15 +921,10 @@ class ViolationTracker:
         """
         if direction != 'down':
             return False
-        max_vel = getattr(
-            self.config, 'SAFE_DOWN_MAX_VELOCITY_DEG_PER_S', 10.0
-        )
-        max_dur = getattr(self.config, 'SAFE_DOWN_MAX_DURATION_SEC', 5.0)
-        max_pitch = getattr(self.config, 'SAFE_DOWN_MAX_PITCH_DEG', 25.0)
         return (
-            velocity_deg_per_s < max_vel
-            and duration_sec < max_dur
-            and max_pitch_deg < max_pitch
+            velocity_deg_per_s < self.safe_down_max_velocity
+            and duration_sec < self.safe_down_max_duration
+            and max_pitch_deg < self.safe_down_max_pitch
         )
 
     # ------------------------------------------------------------------
@@ -785,10 +1020,8 @@ class ViolationTracker:
         gap_compensation = self.gap_tolerance * 0.5
         corrected_end    = end_time + gap_compensation
         duration    = corrected_end - start_time
-        min_dur     = getattr(self.config, 'MIN_EVENT_DURATION', 0.5)
-        min_conf    = getattr(self.config, 'MIN_CONFIDENCE_THRESHOLD', 0.45)
 
-        if duration < min_dur or not direction or confidence < min_conf:
+        if duration < self.min_event_duration or not direction or confidence < self.min_confidence:
             return
 
         # Context-aware: safe downwards look — don't flag writing/thinking
@@ -848,10 +1081,8 @@ class ViolationTracker:
         gap_compensation = self.gap_tolerance * 0.5
         corrected_end    = end_time + gap_compensation
         duration = corrected_end - start_time
-        min_dur  = getattr(self.config, 'MIN_EVENT_DURATION', 0.5)
-        min_conf = getattr(self.config, 'MIN_CONFIDENCE_THRESHOLD', 0.45)
 
-        if duration < min_dur or not direction or confidence < min_conf:
+        if duration < self.min_event_duration or not direction or confidence < self.min_confidence:
             return
 
         # TVT gating (only when TVT is confident)
@@ -889,10 +1120,7 @@ class ViolationTracker:
     def _record_face_missing_event(self, start_time: float, end_time: float) -> None:
         """Record a face-missing event (BUG-4 FIX: guard removed). Uses FACE_MISSING_MIN_DURATION when set."""
         duration = end_time - start_time
-        min_dur  = getattr(self.config, 'FACE_MISSING_MIN_DURATION', None)
-        if min_dur is None:
-            min_dur = getattr(self.config, 'MIN_EVENT_DURATION', 0.5)
-        if duration < min_dur:
+        if duration < self.face_missing_min_duration:
             return
 
         ts = round(start_time, 2)
@@ -912,8 +1140,7 @@ class ViolationTracker:
     ) -> None:
         """Record a face-occlusion event."""
         duration = end_time - start_time
-        min_dur  = getattr(self.config, 'MIN_EVENT_DURATION', 0.5)
-        if duration < min_dur:
+        if duration < self.min_event_duration:
             return
 
         ts = round(start_time, 2)
@@ -962,7 +1189,7 @@ class ViolationTracker:
         only recorded if TVT agrees (matching behavior_class and probability
         >= TVT_PROB_THRESHOLD).
         """
-        tvt_threshold = getattr(self.config, 'TVT_PROB_THRESHOLD', 0.85)
+        tvt_threshold = self.tvt_prob_threshold
         # Compute velocities
         head_velocity = 0.0
         if yaw_history and pitch_history and timestamp_history:
@@ -1011,69 +1238,50 @@ class ViolationTracker:
         # recently — extreme head turns cause MediaPipe to lose the face, which
         # should extend the head_movement event, not create a face_missing event.
         # HEAD_TURN_BRIDGE_SECONDS (default 1.0s) is the suppression window.
-        head_bridge = getattr(self.config, 'HEAD_TURN_BRIDGE_SECONDS', 1.0)
-        within_head_bridge = (timestamp - self._last_active_yaw_time) <= head_bridge
+        within_head_bridge = (timestamp - self._last_active_yaw_time) <= self.head_turn_bridge
 
-        min_start = getattr(self.config, 'FACE_MISSING_MIN_START_DURATION', 0.0)
+        min_start = self.face_missing_min_start
+        state = self.current_face_missing_state
         if num_faces == 0:
-            state = self.current_face_missing_state
             if within_head_bridge:
                 # Face lost during an extreme head turn — extend yaw event instead of logging face_missing
-                if self.current_yaw_state['active']:
-                    self.current_yaw_state['last_update_time'] = timestamp
+                if self.current_yaw_state.active:
+                    self.current_yaw_state.last_update_time = timestamp
                 # Reset any pending face_missing accumulation so it can't open mid-bridge
-                state['first_no_face_time'] = None
-            elif not state['active']:
-                first_no_face = state.get('first_no_face_time')
+                state.pending_since = None
+            elif not state.active:
+                first_no_face = state.pending_since
                 if first_no_face is None:
-                    state['first_no_face_time'] = timestamp
+                    state.pending_since = timestamp
                 elif min_start <= 0 or (timestamp - first_no_face) >= min_start:
-                    state['active'] = True
-                    state['start_time'] = first_no_face
-                    state['last_update_time'] = timestamp
-                    state['first_no_face_time'] = None
+                    state.start(first_no_face, timestamp)
+                    state.pending_since = None
             else:
-                self.current_face_missing_state['last_update_time'] = timestamp
+                state.last_update_time = timestamp
         else:
-            state = self.current_face_missing_state
-            state['first_no_face_time'] = None
-            if state['active']:
-                gap = timestamp - state['last_update_time']
-                if gap > self.gap_tolerance:
-                    self._record_face_missing_event(
-                        state['start_time'],
-                        state['last_update_time'],
-                    )
-                    state['active'] = False
+            state.pending_since = None
+            if state.active and timestamp - state.last_update_time > self.gap_tolerance:
+                self._record_face_missing_event(state.start_time, state.last_update_time)
+                state.active = False
 
         # ── FACE OCCLUSION STATE MACHINE ───────────────────────────────────
-        occ_threshold = getattr(self.config, 'FACE_OCCLUSION_THRESHOLD', 0.30)
-        if num_faces > 0 and occlusion_ratio > occ_threshold:
-            if not self.current_face_occluded_state['active']:
-                self.current_face_occluded_state = {
-                    'active': True, 'start_time': timestamp,
-                    'last_update_time': timestamp, 'max_occlusion': occlusion_ratio,
-                }
+        state = self.current_face_occluded_state
+        if num_faces > 0 and occlusion_ratio > self.face_occlusion_threshold:
+            if not state.active:
+                state.start(timestamp, timestamp, occlusion_ratio)
             else:
-                s = self.current_face_occluded_state
-                s['last_update_time'] = timestamp
-                s['max_occlusion']    = max(s['max_occlusion'], occlusion_ratio)
-        else:
-            if self.current_face_occluded_state['active']:
-                gap = timestamp - self.current_face_occluded_state['last_update_time']
-                if gap > self.gap_tolerance:
-                    self._record_face_occluded_event(
-                        self.current_face_occluded_state['start_time'],
-                        self.current_face_occluded_state['last_update_time'],
-                        self.current_face_occluded_state['max_occlusion'],
-                    )
-                    self.current_face_occluded_state['active'] = False
+                state.last_update_time = timestamp
+                if occlusion_ratio > state.peak:
+                    state.peak = occlusion_ratio
+        elif state.active and timestamp - state.last_update_time > self.gap_tolerance:
+            self._record_face_occluded_event(state.start_time, state.last_update_time, state.peak)
+            state.active = False
 
         # ── MULTIPLE FACES ─────────────────────────────────────────────────
         self._check_multiple_faces(timestamp, num_faces)
 
     def _update_head_axis_state(
-        self, state: Dict, timestamp: float,
+        self, state: _AxisState, timestamp: float,
         direction: str, intensity: float,
         confidence: float, velocity: float,
         tvt_prediction: Optional[Dict] = None,
@@ -1090,47 +1298,30 @@ class ViolationTracker:
         if direction:
             if is_yaw:
                 self._last_active_yaw_time = timestamp   # BUG-8: track yaw activity
-            if not state['active']:
-                state.update({
-                    'active': True, 'start_time': timestamp,
-                    'last_update_time': timestamp, 'direction': direction,
-                    'max_intensity': intensity, 'confidence': confidence,
-                    'velocity': velocity,
-                })
+            if not state.active:
+                state.start(timestamp, direction, intensity, confidence, velocity)
+            elif direction != state.direction:
+                # Direction reversed — record previous, start new
+                self._record_head_event(
+                    state.start_time, state.last_update_time,
+                    state.direction, state.max_intensity,
+                    state.confidence, state.velocity,
+                    tvt_prediction, tvt_prob_threshold,
+                )
+                state.start(timestamp, direction, intensity, confidence, velocity)
             else:
-                if direction != state['direction']:
-                    # Direction reversed — record previous, start new
-                    self._record_head_event(
-                        state['start_time'], state['last_update_time'],
-                        state['direction'], state['max_intensity'],
-                        state['confidence'], state['velocity'],
-                        tvt_prediction, tvt_prob_threshold,
-                    )
-                    state.update({
-                        'active': True, 'start_time': timestamp,
-                        'last_update_time': timestamp, 'direction': direction,
-                        'max_intensity': intensity, 'confidence': confidence,
-                        'velocity': velocity,
-                    })
-                else:
-                    state['max_intensity']    = max(state['max_intensity'], intensity)
-                    state['last_update_time'] = timestamp
-                    state['confidence']       = max(state['confidence'], confidence)
-                    state['velocity']         = max(state['velocity'], velocity)
-        else:
-            if state['active']:
-                gap = timestamp - state['last_update_time']
-                if gap > self.gap_tolerance:
-                    self._record_head_event(
-                        state['start_time'], state['last_update_time'],
-                        state['direction'], state['max_intensity'],
-                        state['confidence'], state['velocity'],
-                        tvt_prediction, tvt_prob_threshold,
-                    )
-                    state['active'] = False
+                state.extend(timestamp, intensity, confidence, velocity)
+        elif state.active and timestamp - state.last_update_time > self.gap_tolerance:
+            self._record_head_event(
+                state.start_time, state.last_update_time,
+                state.direction, state.max_intensity,
+                state.confidence, state.velocity,
+                tvt_prediction, tvt_prob_threshold,
+            )
+            state.active = False
 
     def _update_eye_axis_state(
-        self, state: Dict, timestamp: float,
+        self, state: _AxisState, timestamp: float,
         direction: str, intensity: float,
         confidence: float, velocity: float,
         tvt_prediction: Optional[Dict] = None,
@@ -1141,77 +1332,59 @@ class ViolationTracker:
         Called independently for each axis so both gaze_left/right and gaze_up/down are recorded.
         """
         if direction:
-            if not state['active']:
-                state.update({
-                    'active': True, 'start_time': timestamp,
-                    'last_update_time': timestamp, 'direction': direction,
-                    'max_intensity': intensity, 'confidence': confidence,
-                    'velocity': velocity,
-                })
+            if not state.active:
+                state.start(timestamp, direction, intensity, confidence, velocity)
+            elif direction != state.direction:
+                self._record_eye_event(
+                    state.start_time, state.last_update_time,
+                    state.direction, state.max_intensity,
+                    state.confidence, state.velocity,
+                    tvt_prediction, tvt_prob_threshold,
+                )
+                state.start(timestamp, direction, intensity, confidence, velocity)
             else:
-                if direction != state['direction']:
-                    self._record_eye_event(
-                        state['start_time'], state['last_update_time'],
-                        state['direction'], state['max_intensity'],
-                        state['confidence'], state['velocity'],
-                        tvt_prediction, tvt_prob_threshold,
-                    )
-                    state.update({
-                        'active': True, 'start_time': timestamp,
-                        'last_update_time': timestamp, 'direction': direction,
-                        'max_intensity': intensity, 'confidence': confidence,
-                        'velocity': velocity,
-                    })
-                else:
-                    state['max_intensity']    = max(state['max_intensity'], intensity)
-                    state['last_update_time'] = timestamp
-                    state['confidence']       = max(state['confidence'], confidence)
-                    state['velocity']         = max(state['velocity'], velocity)
-        else:
-            if state['active']:
-                gap = timestamp - state['last_update_time']
-                if gap > self.gap_tolerance:
-                    self._record_eye_event(
-                        state['start_time'], state['last_update_time'],
-                        state['direction'], state['max_intensity'],
-                        state['confidence'], state['velocity'],
-                        tvt_prediction, tvt_prob_threshold,
-                    )
-                    state['active'] = False
+                state.extend(timestamp, intensity, confidence, velocity)
+        elif state.active and timestamp - state.last_update_time > self.gap_tolerance:
+            self._record_eye_event(
+                state.start_time, state.last_update_time,
+                state.direction, state.max_intensity,
+                state.confidence, state.velocity,
+                tvt_prediction, tvt_prob_threshold,
+            )
+            state.active = False
+
+    def _record_multiple_faces_event(self, start_time: float, end_time: float) -> None:
+        """Record a multiple-faces event."""
+        duration = end_time - start_time
+        if duration < self.min_multiple_face_duration:
+            return
+
+        ts = round(start_time, 2)
+        self.counts['multiple_faces'] += 1
+        self.timestamps['multiple_faces'].append(ts)
+        self.violation_events.append({
+            'type':       'multiple_faces',
+            'timestamp':  ts,
+            'duration':   round(duration, 1),
+            'intensity':  0.0,
+            'confidence': 0.9,
+            'velocity':   0.0,
+        })
 
     def _check_multiple_faces(self, timestamp: float, num_faces: int) -> None:
         """Handle multiple-faces detection state machine."""
-        state    = self.active_violations['multiple_faces']
-        is_active = bool(state['active'])
+        state = self.current_multiple_faces_state
 
         if num_faces > 1:
-            if not is_active:
-                state.update({
-                    'active': True, 'start_time': timestamp,
-                    'last_update_time': timestamp, 'duration': 0.0,
-                    'max_intensity': float(num_faces), 'confidence': 0.9, 'velocity': 0.0,
-                })
+            if not state.active:
+                state.start(timestamp, timestamp, float(num_faces))
             else:
-                state['last_update_time'] = timestamp
-                state['duration']         = timestamp - float(state['start_time'])
-                state['max_intensity']    = max(float(state['max_intensity']), float(num_faces))
-        else:
-            if is_active:
-                duration = float(state['last_update_time']) - float(state['start_time'])
-                min_dur  = getattr(self.config, 'MIN_MULTIPLE_FACE_DURATION', 0.3)
-                if duration >= min_dur:
-                    ts = round(float(state['start_time']), 2)
-                    self.counts['multiple_faces'] += 1
-                    self.timestamps['multiple_faces'].append(ts)
-                    self.violation_events.append({
-                        'type':       'multiple_faces',
-                        'timestamp':  ts,
-                        'duration':   round(duration, 1),
-                        'intensity':  0.0,
-                        'confidence': float(state['confidence']),
-                        'velocity':   0.0,
-                    })
-                state['active'] = False
+                state.last_update_time = timestamp
+                if num_faces > state.peak:
+                    state.peak = float(num_faces)
+        elif state.active:
+            self._record_multiple_faces_event(state.start_time, state.last_update_time)
+            state.active = False
 
     # ------------------------------------------------------------------
     # Result accessors
@@ -1233,85 +1406,39 @@ class ViolationTracker:
 
     def finalize(self) -> None:
         """Flush any still-active violation states at end of video."""
-        # Head yaw
-        if self.current_yaw_state['active']:
-            self._record_head_event(
-                self.current_yaw_state['start_time'],
-                self.current_yaw_state['last_update_time'],
-                self.current_yaw_state['direction'],
-                self.current_yaw_state['max_intensity'],
-                self.current_yaw_state['confidence'],
-                self.current_yaw_state['velocity'],
-            )
-            self.current_yaw_state['active'] = False
-
-        # Head pitch
-        if self.current_pitch_state['active']:
-            self._record_head_event(
-                self.current_pitch_state['start_time'],
-                self.current_pitch_state['last_update_time'],
-                self.current_pitch_state['direction'],
-                self.current_pitch_state['max_intensity'],
-                self.current_pitch_state['confidence'],
-                self.current_pitch_state['velocity'],
-            )
-            self.current_pitch_state['active'] = False
-
-        # Eye gaze (horizontal and vertical)
-        if self.current_eye_h_state['active']:
-            self._record_eye_event(
-                self.current_eye_h_state['start_time'],
-                self.current_eye_h_state['last_update_time'],
-                self.current_eye_h_state['direction'],
-                self.current_eye_h_state['max_intensity'],
-                self.current_eye_h_state['confidence'],
-                self.current_eye_h_state['velocity'],
-            )
-            self.current_eye_h_state['active'] = False
-        if self.current_eye_v_state['active']:
-            self._record_eye_event(
-                self.current_eye_v_state['start_time'],
-                self.current_eye_v_state['last_update_time'],
-                self.current_eye_v_state['direction'],
-                self.current_eye_v_state['max_intensity'],
-                self.current_eye_v_state['confidence'],
-                self.current_eye_v_state['velocity'],
-            )
-            self.current_eye_v_state['active'] = False
+        # Head yaw / pitch, then eye gaze (horizontal and vertical)
+        for state in (self.current_yaw_state, self.current_pitch_state):
+            if state.active:
+                self._record_head_event(
+                    state.start_time, state.last_update_time,
+                    state.direction, state.max_intensity,
+                    state.confidence, state.velocity,
+                )
+                state.active = False
+        for state in (self.current_eye_h_state, self.current_eye_v_state):
+            if state.active:
+                self._record_eye_event(
+                    state.start_time, state.last_update_time,
+                    state.direction, state.max_intensity,
+                    state.confidence, state.velocity,
+                )
+                state.active = False
 
         # Face missing
-        if self.current_face_missing_state['active']:
-            self._record_face_missing_event(
-                self.current_face_missing_state['start_time'],
-                self.current_face_missing_state['last_update_time'],
-            )
-            self.current_face_missing_state['active'] = False
-        self.current_face_missing_state['first_no_face_time'] = None
+        state = self.current_face_missing_state
+        if state.active:
+            self._record_face_missing_event(state.start_time, state.last_update_time)
+            state.active = False
+        state.pending_since = None
 
         # Face occluded
-        if self.current_face_occluded_state['active']:
-            self._record_face_occluded_event(
-                self.current_face_occluded_state['start_time'],
-                self.current_face_occluded_state['last_update_time'],
-                self.current_face_occluded_state['max_occlusion'],
-            )
-            self.current_face_occluded_state['active'] = False
+        state = self.current_face_occluded_state
+        if state.active:
+            self._record_face_occluded_event(state.start_time, state.last_update_time, state.peak)
+            state.active = False
 
         # Multiple faces
-        mf = self.active_violations['multiple_faces']
-        if mf['active']:
-            duration = float(mf['last_update_time']) - float(mf['start_time'])
-            min_dur  = getattr(self.config, 'MIN_MULTIPLE_FACE_DURATION', 0.3)
-            if duration >= min_dur:
-                ts = round(float(mf['start_time']), 2)
-                self.counts['multiple_faces'] += 1
-                self.timestamps['multiple_faces'].append(ts)
-                self.violation_events.append({
-                    'type':       'multiple_faces',
-                    'timestamp':  ts,
-                    'duration':   round(duration, 1),
-                    'intensity':  0.0,
-                    'confidence': float(mf['confidence']),
-                    'velocity':   0.0,
-                })
-            mf['active'] = False
\ No newline at end of file
+        state = self.current_multiple_faces_state
+        if state.active:
+            self._record_multiple_faces_event(state.start_time, state.last_update_time)
+            state.active = False
\ No newline at end of file
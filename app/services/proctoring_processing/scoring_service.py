@@ -289,7 +289,7 @@ class ScoringService(BaseService):
             )
 
         self.log_info(
-            f"Report generated | Risk Level={risk_level.value} | Risk Score={risk_score}/100"
+            "Report generated | Risk Level=%s | Risk Score=%s/100", risk_level.value, risk_score
         )
 
         return {
@@ -15,12 +15,15 @@ Changes vs previous version
   easier debugging of suspicious-event windows.
 """
 import cv2
+import logging
 import numpy as np
 import tempfile
 import os
+import time
 import queue
+import shutil
 import threading
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 import requests
 from app.utils.logger import debug_logger
 
@@ -31,6 +34,12 @@ from .detection_service import DetectionService
 
 # Sentinel for end of stream in parallel pipeline
 _SENTINEL = object()
+# Frames in flight between pipeline stages; small to bound decoded-frame memory
+_PIPELINE_QUEUE_SIZE = 4
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Frames alive at once: the queue, the one being consumed and the one the
+# reader is writing
+_FRAME_POOL_SIZE = _PIPELINE_QUEUE_SIZE + 2
 
 
 class VideoProcessingService(IVideoProcessingService):
@@ -47,24 +56,151 @@ class VideoProcessingService(IVideoProcessingService):
         self.detection_service = DetectionService(self.config)
         debug_logger.info("VideoProcessingService initialised")
 
+    # ------------------------------------------------------------------
+    # Decoder
+    # ------------------------------------------------------------------
+
+    def _open_capture(self, video_path: str) -> cv2.VideoCapture:
+        """
+        Open the video, asking FFmpeg for hardware decode when enabled.
+
+        VIDEO_ACCELERATION_ANY lets OpenCV pick VAAPI/D3D11/MFX and quietly
+        decode in software when none is available; a backend that fails to
+        open with the hint is retried without it.
+        """
+        if getattr(self.config, 'ENABLE_HW_DECODE', False):
+            cap = cv2.VideoCapture(
+                video_path,
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+            )
+            if cap.isOpened():
+                debug_logger.info(
+                    "Decoder hw_acceleration=%s",
+                    int(cap.get(cv2.CAP_PROP_HW_ACCELERATION)),
+                )
+                return cap
+            cap.release()
+            debug_logger.warning("Hardware decode unavailable, using software decode")
+        return cv2.VideoCapture(video_path)
+
     # ------------------------------------------------------------------
     # Frame resize
     # ------------------------------------------------------------------
 
-    def _resize_frame(self, frame: np.ndarray) -> np.ndarray:
-        h, w    = frame.shape[:2]
+    def _resize_target(self, w: int, h: int) -> Optional[Tuple[int, int]]:
+        """
+        Output size for frames of w x h, or None when no resize is needed.
+        Frame size is fixed for a file, so this runs once per video.
+        """
         max_dim = max(h, w)
         if max_dim > self.config.MAX_FRAME_DIMENSION:
             scale = self.config.MAX_FRAME_DIMENSION / max_dim
-            frame = cv2.resize(
-                frame,
-                (int(w * scale), int(h * scale)),
-                interpolation=cv2.INTER_LINEAR,
-            )
-        return frame
+            return int(w * scale), int(h * scale)
+        return None
+
+    def _resize_frame(
+        self, frame: np.ndarray, dsize: Tuple[int, int], dst: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        # dsize is computed once per video; dst reuses the caller's buffer
+        return cv2.resize(frame, dsize, dst=dst, interpolation=cv2.INTER_LINEAR)
 
     # ------------------------------------------------------------------
-    # Parallel pipeline (3 threads: reader, analyzer, aggregator)
+    # Frame prefetch (reader thread)
+    # ------------------------------------------------------------------
+
+    def _prefetch_frames(
+        self, cap: cv2.VideoCapture, fps: float, frame_skip: int,
+    ) -> Iterator[Tuple[float, np.ndarray]]:
+        """
+        Yield (timestamp, resized frame) for every sampled frame, in order.
+
+        Decoding, frame skipping and resizing run on a background thread that
+        stays up to _PIPELINE_QUEUE_SIZE frames ahead, so the decoder works
+        while the consumer runs detection. Reader errors are re-raised here.
+
+        Yielded frames live in a small ring of preallocated buffers and are
+        overwritten once the consumer has moved _FRAME_POOL_SIZE frames on;
+        callers must copy a frame they want to keep.
+        """
+        frames: queue.Queue = queue.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        def put(item) -> None:
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def reader() -> None:
+            frame_idx = 0
+            dsize: Optional[Tuple[int, int]] = None
+            raw_buf: Optional[np.ndarray] = None
+            pool: List[np.ndarray] = []
+            slot = 0
+            try:
+                while not stop.is_set():
+                    if not cap.grab():
+                        break
+                    if not pool:
+                        # First sampled frame: size the buffers once
+                        ret, frame = cap.retrieve()
+                        if not ret:
+                            break
+                        h, w = frame.shape[:2]
+                        dsize = self._resize_target(w, h)
+                        if dsize is None:
+                            out_shape = frame.shape
+                        else:
+                            raw_buf = frame
+                            out_shape = (dsize[1], dsize[0]) + frame.shape[2:]
+                            frame = self._resize_frame(raw_buf, dsize)
+                        pool = [np.empty(out_shape, frame.dtype)
+                                for _ in range(_FRAME_POOL_SIZE - 1)]
+                        pool.append(frame)
+                        slot = _FRAME_POOL_SIZE - 1
+                    else:
+                        slot = (slot + 1) % _FRAME_POOL_SIZE
+                        if dsize is None:
+                            ret, frame = cap.retrieve(pool[slot])
+                            if not ret:
+                                break
+                        else:
+                            ret, raw_buf = cap.retrieve(raw_buf)
+                            if not ret:
+                                break
+                            frame = self._resize_frame(raw_buf, dsize, pool[slot])
+                    put((frame_idx / fps, frame))
+                    frame_idx += frame_skip
+                    # Frames between samples are only grabbed: grab() decodes
+                    # without the colour conversion and copy out of retrieve().
+                    # Past the end of the stream grab() keeps returning False
+                    for _ in range(frame_skip - 1):
+                        cap.grab()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                put(_SENTINEL)
+
+        t_reader = threading.Thread(target=reader, daemon=True)
+        t_reader.start()
+        try:
+            while True:
+                item = frames.get()
+                if item is _SENTINEL:
+                    break
+                yield item
+        finally:
+            stop.set()
+            t_reader.join()
+        if errors:
+            raise errors[0]
+
+    # ------------------------------------------------------------------
+    # Parallel pipeline (reader thread, analyzer thread, calling thread)
     # ------------------------------------------------------------------
 
     def _run_parallel_pipeline(
@@ -75,95 +211,76 @@ class VideoProcessingService(IVideoProcessingService):
         thresholds: Dict[str, float],
         warmup: float,
     ) -> int:
-        """Run frame reader, analyzer, and aggregator in parallel. Returns frames_processed."""
-        frame_queue: queue.Queue = queue.Queue(maxsize=60)
-        results_queue: queue.Queue = queue.Queue(maxsize=60)
-        frames_processed = [0]  # mutable so aggregator can update
+        """
+        Overlap frame decoding, FaceMesh inference and violation tracking.
 
-        def reader() -> None:
-            frame_idx = 0
+        The reader thread decodes and resizes sampled frames, the analyzer
+        thread runs detection (MediaPipe and OpenCV release the GIL while they
+        work) and the calling thread feeds results to the violation tracker.
+        A single analyzer keeps frames in order, which the Kalman / gaze
+        history state depends on. Returns frames_processed.
+        """
+        results_queue: queue.Queue = queue.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        def put(q: queue.Queue, item) -> bool:
+            """Block until queued, unless the pipeline is shutting down."""
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def analyzer() -> None:
+            detection = self.detection_service
+            enable_tvt = getattr(self.config, 'ENABLE_TVT', False)
             try:
-                while True:
-                    ret, frame = cap.read()
-                    if not ret:
+                for current_time, frame in self._prefetch_frames(cap, fps, frame_skip):
+                    gaze, pose, landmark_vector = detection.detect_all(frame, enable_tvt)
+                    if not put(results_queue, (current_time, gaze, pose, landmark_vector)):
                         break
-                    if frame_idx % frame_skip != 0:
-                        frame_idx += 1
-                        continue
-                    current_time = frame_idx / fps
-                    frame = self._resize_frame(frame)
-                    frame_queue.put((frame_idx, current_time, frame))
-                    frame_idx += 1
+            except Exception as e:
+                errors.append(e)
+                stop.set()
             finally:
-                frame_queue.put(_SENTINEL)
+                put(results_queue, _SENTINEL)
 
-        def analyzer() -> None:
-            enable_tvt = getattr(self.config, 'ENABLE_TVT', False)
-            while True:
-                try:
-                    item = frame_queue.get(timeout=1.0)
-                except queue.Empty:
-                    continue
-                if item is _SENTINEL:
-                    results_queue.put(_SENTINEL)
-                    return
-                frame_idx, current_time, frame = item
-                gaze_h, gaze_v, num_faces, bbox_center, gaze_confidence, occlusion_ratio = \
-                    self.detection_service.detect_gaze(frame)
-                yaw, pitch, roll, head_confidence = \
-                    self.detection_service.detect_head_pose(frame)
-                landmark_vector = None
-                if enable_tvt:
-                    landmark_vector = self.detection_service.get_landmark_vector(frame)
-                results_queue.put((frame_idx, {
-                    'timestamp': current_time,
-                    'gaze_h': gaze_h, 'gaze_v': gaze_v,
-                    'yaw': yaw, 'pitch': pitch, 'roll': roll,
-                    'num_faces': num_faces,
-                    'gaze_confidence': gaze_confidence,
-                    'head_confidence': head_confidence,
-                    'occlusion_ratio': occlusion_ratio,
-                    'landmark_vector': landmark_vector,
-                }))
-
-        def aggregator() -> None:
-            buffer: Dict[int, Dict] = {}
-            next_expected = 0
-            count = 0
+        t_analyzer = threading.Thread(target=analyzer, daemon=True)
+        t_analyzer.start()
+
+        count = 0
+        try:
             while True:
                 try:
-                    item = results_queue.get(timeout=1.0)
+                    item = results_queue.get(timeout=0.5)
                 except queue.Empty:
-                    continue
+                    if t_analyzer.is_alive():
+                        continue
+                    break
                 if item is _SENTINEL:
                     break
-                frame_idx, result = item
-                buffer[frame_idx] = result
-                while next_expected in buffer:
-                    r = buffer.pop(next_expected)
-                    if r['timestamp'] >= warmup:
-                        self.detection_service.update_violations(
-                            r['timestamp'],
-                            r['gaze_h'], r['gaze_v'],
-                            r['yaw'], r['pitch'], r['roll'],
-                            r['num_faces'], thresholds,
-                            r['gaze_confidence'], r['head_confidence'], r['occlusion_ratio'],
-                            landmark_vector=r.get('landmark_vector'),
-                        )
-                    count += 1
-                    next_expected += 1
-            frames_processed[0] = count
+                current_time, gaze, pose, landmark_vector = item
+                gaze_h, gaze_v, num_faces, _, gaze_confidence, occlusion_ratio = gaze
+                yaw, pitch, roll, head_confidence = pose
+                if current_time >= warmup:
+                    self.detection_service.update_violations(
+                        current_time, gaze_h, gaze_v,
+                        yaw, pitch, roll,
+                        num_faces, thresholds,
+                        gaze_confidence, head_confidence, occlusion_ratio,
+                        landmark_vector=landmark_vector,
+                    )
+                count += 1
+        finally:
+            stop.set()
+            t_analyzer.join()
 
-        t_reader = threading.Thread(target=reader)
-        t_analyzer = threading.Thread(target=analyzer)
-        t_aggregator = threading.Thread(target=aggregator)
-        t_reader.start()
-        t_analyzer.start()
-        t_aggregator.start()
-        t_reader.join()
-        t_analyzer.join()
-        t_aggregator.join()
-        return frames_processed[0]
+        if errors:
+            raise errors[0]
+        return count
 
     # ------------------------------------------------------------------
     # Video download
@@ -173,19 +290,20 @@ class VideoProcessingService(IVideoProcessingService):
         """Download video from URL into a temporary file."""
         tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4')
         temp_path = tmp.name
-        tmp.close()
         try:
             debug_logger.info(f"Downloading video: {video_url}")
-            resp = requests.get(video_url, stream=True, timeout=60)
-            resp.raise_for_status()
-            with open(temp_path, 'wb') as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with tmp, requests.get(video_url, stream=True, timeout=60) as resp:
+                resp.raise_for_status()
+                # Undo any Content-Encoding, then copy in 1 MiB blocks
+                resp.raw.decode_content = True
+                shutil.copyfileobj(resp.raw, tmp, _DOWNLOAD_CHUNK_SIZE)
             debug_logger.info(f"Download complete → {temp_path}")
             return temp_path
         except Exception as e:
-            if os.path.exists(temp_path):
+            try:
                 os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
             raise VideoDownloadError(f"Failed to download video: {e}", 5010)
 
     # ------------------------------------------------------------------
@@ -208,7 +326,6 @@ class VideoProcessingService(IVideoProcessingService):
         dict
             Complete proctoring report.
         """
-        import time
         start_time        = time.time()
         downloaded_file   = None
         video_path_to_use = video_path
@@ -218,7 +335,7 @@ class VideoProcessingService(IVideoProcessingService):
                 downloaded_file   = self._download_video(video_path)
                 video_path_to_use = downloaded_file
 
-            cap = cv2.VideoCapture(video_path_to_use)
+            cap = self._open_capture(video_path_to_use)
             if not cap.isOpened():
                 raise VideoProcessingError(
                     f"Cannot open video: {video_path_to_use}", 5011
@@ -248,50 +365,34 @@ class VideoProcessingService(IVideoProcessingService):
             )
 
             warmup = getattr(self.config, 'WARMUP_SECONDS', 0.0)
-            frame_idx        = 0
             frames_processed = 0
 
-
             if getattr(self.config, 'ENABLE_PARALLEL_PROCESSING', False):
                 debug_logger.info("Using parallel 3-thread pipeline")
                 frames_processed = self._run_parallel_pipeline(
                     cap, fps, frame_skip, thresholds, warmup,
                 )
             else:
-                while True:
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
-
-                    if frame_idx % frame_skip != 0:
-                        frame_idx += 1
-                        continue
-
-                    frame        = self._resize_frame(frame)
-                    current_time = frame_idx / fps
-
+                enable_tvt = getattr(self.config, 'ENABLE_TVT', False)
+                log_frames = debug_logger.isEnabledFor(logging.INFO)
+                # Frames are decoded on a prefetch thread; detection and
+                # violation tracking stay on this thread
+                for current_time, frame in self._prefetch_frames(cap, fps, frame_skip):
+                    # One FaceMesh pass per frame, shared by all detectors;
+                    # landmark vector only when TVT is enabled
+                    gaze, pose, landmark_vector = \
+                        self.detection_service.detect_all(frame, enable_tvt)
                     (gaze_h, gaze_v, num_faces, bbox_center,
-                     gaze_confidence, occlusion_ratio) = \
-                        self.detection_service.detect_gaze(frame)
-
-                    yaw, pitch, roll, head_confidence = \
-                        self.detection_service.detect_head_pose(frame)
-
-                    # Optional: landmark vector for TVT
-                    landmark_vector = None
-                    if getattr(self.config, 'ENABLE_TVT', False):
-                        landmark_vector = self.detection_service.get_landmark_vector(frame)
+                     gaze_confidence, occlusion_ratio) = gaze
+                    yaw, pitch, roll, head_confidence = pose
 
                     # Log every 30 processed frames for debugging suspicious windows
-                    if frames_processed % 30 == 0:
+                    if log_frames and frames_processed % 30 == 0:
                         debug_logger.info(
-                            f"[{current_time:.1f}s] "
-                            f"gaze=({gaze_h},{gaze_v}) "
-                            f"head=({yaw},{pitch}) "
-                            f"faces={num_faces} "
-                            f"g_conf={gaze_confidence:.2f} "
-                            f"h_conf={head_confidence:.2f} "
-                            f"occ={occlusion_ratio:.2f}"
+                            "[%.1fs] gaze=(%s,%s) head=(%s,%s) faces=%s "
+                            "g_conf=%.2f h_conf=%.2f occ=%.2f",
+                            current_time, gaze_h, gaze_v, yaw, pitch, num_faces,
+                            gaze_confidence, head_confidence, occlusion_ratio,
                         )
 
                     if current_time >= warmup:
@@ -304,7 +405,6 @@ class VideoProcessingService(IVideoProcessingService):
                         )
 
                     frames_processed += 1
-                    frame_idx        += 1
 
             cap.release()
             self.detection_service.violation_tracker.finalize()
@@ -329,9 +429,11 @@ class VideoProcessingService(IVideoProcessingService):
             raise VideoProcessingError(f"Video processing failed: {e}", 5012)
 
         finally:
-            if downloaded_file and os.path.exists(downloaded_file):
+            if downloaded_file:
                 try:
                     os.unlink(downloaded_file)
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     debug_logger.warning(f"Failed to delete temp file: {e}")
 
@@ -354,19 +456,39 @@ class VideoProcessingService(IVideoProcessingService):
         """
         events = self.detection_service.get_violation_events()
         debug_logger.info(f"Total violation events: {len(events)}")
+        if not events:
+            # Clean session: nothing to bucket, filter or format
+            return self._build_report(
+                session_id, [], thresholds,
+                processing_time, video_duration, frames_processed,
+            )
+
+        head_events:          List[Dict] = []
+        eye_events:           List[Dict] = []
+        face_missing_events:  List[Dict] = []
+        multi_face_events:    List[Dict] = []
+        face_occluded_events: List[Dict] = []
+        other_buckets = {
+            'face_missing':   face_missing_events,
+            'multiple_faces': multi_face_events,
+            'face_occluded':  face_occluded_events,
+        }
 
-        # Tally by type for debug logging
+        # Single pass: tally by type for debug logging and bucket by gesture
         tally: Dict[str, int] = {}
         for ev in events:
-            tally[ev['type']] = tally.get(ev['type'], 0) + 1
+            etype = ev['type']
+            tally[etype] = tally.get(etype, 0) + 1
+            if etype.startswith('head_'):
+                head_events.append(ev)
+            elif etype.startswith('gaze_'):
+                eye_events.append(ev)
+            else:
+                bucket = other_buckets.get(etype)
+                if bucket is not None:
+                    bucket.append(ev)
         debug_logger.info(f"Event breakdown: {tally}")
 
-        head_events          = [e for e in events if e['type'].startswith('head_')]
-        eye_events           = [e for e in events if e['type'].startswith('gaze_')]
-        face_missing_events  = [e for e in events if e['type'] == 'face_missing']
-        multi_face_events    = [e for e in events if e['type'] == 'multiple_faces']
-        face_occluded_events = [e for e in events if e['type'] == 'face_occluded']
-
         # Apply high-risk filter when enabled (only suspicious/high-risk in output)
         report_only_high_risk = getattr(self.config, 'REPORT_ONLY_HIGH_RISK', False)
         if report_only_high_risk:
@@ -469,6 +591,21 @@ class VideoProcessingService(IVideoProcessingService):
                 ],
             })
 
+        return self._build_report(
+            session_id, gestures, thresholds,
+            processing_time, video_duration, frames_processed,
+        )
+
+    def _build_report(
+        self,
+        session_id: str,
+        gestures: List[Dict],
+        thresholds: Dict,
+        processing_time: float,
+        video_duration: float,
+        frames_processed: int,
+    ) -> Dict:
+        """Wrap the gesture list in the report envelope."""
         return {
             "session_id": session_id,
             "status": "success",
@@ -530,14 +667,16 @@ class VideoProcessingService(IVideoProcessingService):
 
     def _fmt_ts(self, seconds: float) -> str:
         """Convert seconds to M:SS timestamp string."""
-        m = int(seconds // 60)
-        s = int(seconds % 60)
-        return f"{m}:{s:02d}"
+        return "%d:%02d" % divmod(int(seconds), 60)
 
     # ------------------------------------------------------------------
     # Cleanup
     # ------------------------------------------------------------------
 
+    def reset(self) -> None:
+        """Prepare this instance for another process_video call."""
+        self.detection_service.reset()
+
     def cleanup(self) -> None:
         self.detection_service.cleanup()
         debug_logger.info("VideoProcessingService cleaned up")
@@ -3,19 +3,74 @@ Proctoring Service
 Main service orchestrating all proctoring business logic
 """
 from app.utils.logger import debug_logger
-from typing import Dict, Optional, List
-import uuid
+from typing import AsyncIterator, Dict, Optional, List, Tuple
+import asyncio
 import os
 import tempfile
-import json
+import queue
 import re
+from concurrent.futures import Executor
 
-from app.core.config import ProctoringConfig
+from app.core import cache
+from app.utils.ids import new_id
+from app.core.config import PROCTORING_CONFIG
 from app.core.exceptions import VideoProcessingError, DatabaseError, ReportNotFoundError, ValidationError
 from app.repositories.base_repository import IRepository
 from app.models.proctoring import ProctoringReport
 from app.services.base_service import IProctoringService
-from app.services.proctoring_processing import VideoProcessingService
+from app.services import proctoring_processing
+
+# Chunk size used when streaming video uploads to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Idle VideoProcessingService instances, reused so FaceMesh is built once per
+# concurrent worker rather than once per video. Process-local: with a process
+# pool every worker process keeps its own.
+_idle_processors: "queue.SimpleQueue" = queue.SimpleQueue()
+
+
+def _copy_upload(src, dst, max_bytes: int) -> int:
+    """
+    Copy an upload's spooled file into dst in fixed-size chunks
+    Stops as soon as more than max_bytes have been read
+
+    Returns:
+        Number of bytes read from src
+    """
+    size = 0
+    while chunk := src.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_bytes:
+            break
+        dst.write(chunk)
+    return size
+
+
+def analyze_video(video_path: str, interview_id: str) -> Dict:
+    """
+    Run the video analysis pipeline and return the raw report
+    Module-level (no service state) so it can be dispatched to a process pool
+
+    Args:
+        video_path: Path or URL to video
+        interview_id: Interview ID
+
+    Returns:
+        Report dictionary from VideoProcessingService
+    """
+    try:
+        processor = _idle_processors.get_nowait()
+    except queue.Empty:
+        processor = proctoring_processing.VideoProcessingService(PROCTORING_CONFIG)
+    try:
+        return processor.process_video(video_path, interview_id)
+    finally:
+        try:
+            processor.reset()
+        except Exception:
+            processor.cleanup()
+        else:
+            _idle_processors.put(processor)
 
 
 class ProctoringService(IProctoringService):
@@ -24,15 +79,17 @@ class ProctoringService(IProctoringService):
     Orchestrates all business logic and coordinates between services
     """
 
-    def __init__(self, repository: IRepository[ProctoringReport]):
+    def __init__(self, repository: IRepository[ProctoringReport], executor: Optional[Executor] = None):
         """
         Initialize proctoring service with injected dependencies
 
         Args:
             repository: Repository implementing IRepository base interface
+            executor: Executor for CPU-bound video analysis (default thread pool if None)
         """
         self.repository = repository
-        self.config = ProctoringConfig()
+        self.executor = executor
+        self.config = PROCTORING_CONFIG
         debug_logger.info("Proctoring service initialized")
 
     async def process_video_upload(
@@ -58,7 +115,7 @@ class ProctoringService(IProctoringService):
         temp_path = None
 
         try:
-            interview_id = interview_id or str(uuid.uuid4())
+            interview_id = interview_id or new_id()
             debug_logger.info(f"Processing uploaded video for interview: {interview_id}")
 
             # Validate file format
@@ -66,34 +123,14 @@ class ProctoringService(IProctoringService):
             if file_ext not in self.config.ALLOWED_VIDEO_FORMATS:
                 raise ValidationError(f"Unsupported video format: {file_ext}", 4001)
 
-            # Create temp file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=file_ext)
-            temp_path = temp_file.name
-            temp_file.close()
-
-            # Read and save video content
-            content = await video_file.read()
-
-            with open(temp_path, 'wb') as f:
-                f.write(content)
-
-            # Validate file size
-            file_size_mb = len(content) / (1024 * 1024)
-            if file_size_mb > self.config.MAX_VIDEO_SIZE_MB:
-                raise ValidationError(
-                    f"Video file too large: {file_size_mb:.2f}MB exceeds maximum {self.config.MAX_VIDEO_SIZE_MB}MB",
-                    4002
-                )
+            # Stream upload to a temp file, enforcing the size limit as chunks arrive
+            temp_path, file_size = await self._save_upload(video_file, file_ext)
+            file_size_mb = file_size / (1024 * 1024)
 
             debug_logger.info(f"Video file size: {file_size_mb:.2f} MB")
 
-            # Process video
-            result = self.process_video_file(temp_path, interview_id)
-
-            # Format response
-            formatted_result = self._format_json_response(result)
-
-            return json.loads(formatted_result)
+            # Process video; the router's ORJSONResponse serializes the dict
+            return await self.process_video_file(temp_path, interview_id)
 
         except (ValidationError, VideoProcessingError, DatabaseError):
             raise
@@ -102,13 +139,48 @@ class ProctoringService(IProctoringService):
             raise VideoProcessingError(f"Failed to process video upload: {str(e)}", 5001)
         finally:
             # Cleanup temp file
-            if temp_path and os.path.exists(temp_path):
+            if temp_path:
                 try:
                     os.unlink(temp_path)
                     debug_logger.debug(f"Cleaned up temp file: {temp_path}")
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     debug_logger.warning(f"Failed to cleanup temp file {temp_path}: {str(e)}")
 
+    async def _save_upload(self, video_file, file_ext: str) -> Tuple[str, int]:
+        """
+        Stream uploaded video to a temp file in fixed-size chunks
+        The copy runs in one worker thread instead of hopping to the
+        threadpool for every chunk read and writing on the event loop
+
+        Args:
+            video_file: UploadFile object from FastAPI
+            file_ext: File extension used as temp file suffix
+
+        Returns:
+            Tuple of (temp_path, file_size_bytes)
+
+        Raises:
+            ValidationError: If the upload exceeds MAX_VIDEO_SIZE_MB
+        """
+        max_bytes = self.config.MAX_VIDEO_SIZE_MB * 1024 * 1024
+
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=file_ext)
+        try:
+            with temp_file:
+                file_size = await asyncio.to_thread(_copy_upload, video_file.file, temp_file, max_bytes)
+            if file_size > max_bytes:
+                raise ValidationError(
+                    f"Video file too large: exceeds maximum {self.config.MAX_VIDEO_SIZE_MB}MB",
+                    4002
+                )
+        except BaseException:
+            os.unlink(temp_file.name)
+            raise
+
+        return temp_file.name, file_size
+
     async def process_video_from_url(
         self,
         video_url: str,
@@ -134,16 +206,11 @@ class ProctoringService(IProctoringService):
             if not video_url or not video_url.strip():
                 raise ValidationError("video_url is required and cannot be empty", 4003)
 
-            interview_id = interview_id or str(uuid.uuid4())
+            interview_id = interview_id or new_id()
             debug_logger.info(f"Processing video from URL for interview: {interview_id}")
 
-            # Process video
-            result = self.process_video_file(video_url, interview_id)
-
-            # Format response
-            formatted_result = self._format_json_response(result)
-
-            return json.loads(formatted_result)
+            # Process video; the router's ORJSONResponse serializes the dict
+            return await self.process_video_file(video_url, interview_id)
 
         except (ValidationError, VideoProcessingError, DatabaseError):
             raise
@@ -151,7 +218,7 @@ class ProctoringService(IProctoringService):
             debug_logger.error(f"Unexpected error processing video from URL: {str(e)}", exc_info=True)
             raise VideoProcessingError(f"Failed to process video from URL: {str(e)}", 5001)
 
-    def process_video_file(
+    async def process_video_file(
         self,
         video_path: str,
         interview_id: Optional[str] = None
@@ -159,6 +226,10 @@ class ProctoringService(IProctoringService):
         """
         Process video file and generate proctoring report with database persistence
 
+        Analysis is CPU-bound, so it is dispatched to the injected process pool
+        (or the default thread pool when none is configured) to keep the event
+        loop free while a video decodes.
+
         Args:
             video_path: Path or URL to video
             interview_id: Optional interview ID. If not provided, a new interview will be created.
@@ -170,15 +241,34 @@ class ProctoringService(IProctoringService):
             VideoProcessingError: If video processing fails
             DatabaseError: If database operation fails
         """
-        interview_id = interview_id or str(uuid.uuid4())
+        interview_id = interview_id or new_id()
         debug_logger.info(f"Processing video for interview: {interview_id}")
+        loop = asyncio.get_running_loop()
 
         try:
-            # Process video using video processing service
-            processor = VideoProcessingService(self.config)
-            report = processor.process_video(video_path, interview_id)
-            processor.cleanup()
+            report = await loop.run_in_executor(self.executor, analyze_video, video_path, interview_id)
+        except Exception as e:
+            debug_logger.error(f"Error processing video for interview {interview_id}: {str(e)}", exc_info=True)
+            raise VideoProcessingError(f"Video processing failed: {str(e)}", 5001)
+
+        return await self._persist_analysis(interview_id, report)
+
+    async def _persist_analysis(self, interview_id: str, report: Dict) -> Dict:
+        """
+        Save an analysis report to the database and build the API result
 
+        Args:
+            interview_id: Interview ID
+            report: Report returned by analyze_video
+
+        Returns:
+            Processing result with interview ID and gestures
+
+        Raises:
+            VideoProcessingError: If the report cannot be handled
+            DatabaseError: If database operation fails
+        """
+        try:
             gestures = report.get("analysis", {}).get("gestures", [])
             debug_logger.info(f"Extracted {len(gestures)} gesture types from report")
 
@@ -192,7 +282,8 @@ class ProctoringService(IProctoringService):
             fps = processing_metadata.get("fps", 12.0)
 
             # Save all data to database
-            self._save_complete_report(interview_id, report, video_duration, fps)
+            await self._save_complete_report(interview_id, report, video_duration, fps)
+            cache.invalidate_report(interview_id)
 
             debug_logger.info(f"Video processed successfully for interview: {interview_id}")
 
@@ -207,34 +298,7 @@ class ProctoringService(IProctoringService):
             debug_logger.error(f"Error processing video for interview {interview_id}: {str(e)}", exc_info=True)
             raise VideoProcessingError(f"Video processing failed: {str(e)}", 5001)
 
-    def _format_json_response(self, data: dict) -> str:
-        """
-        Format JSON response with compact arrays for timestamps
-
-        Args:
-            data: Dictionary to format
-
-        Returns:
-            Formatted JSON string
-        """
-        if hasattr(data, 'dict'):
-            data = data.dict()
-        elif hasattr(data, 'model_dump'):
-            data = data.model_dump()
-
-        json_str = json.dumps(data, indent=2, ensure_ascii=False)
-
-        def replace_timestamps(match):
-            array_content = match.group(1)
-            numbers = re.findall(r'[\d.]+', array_content)
-            if numbers:
-                return '"timestamps": [' + ', '.join(numbers) + ']'
-            return match.group(0)
-
-        json_str = re.sub(r'"timestamps":\s*\[(.*?)\]', replace_timestamps, json_str, flags=re.DOTALL)
-        return json_str
-
-    def _save_report(self, session_id: str, candidate_id: Optional[str], report: Dict,
+    async def _save_report(self, session_id: str, candidate_id: Optional[str], report: Dict,
                      video_duration: float = 0.0, fps: float = 12.0):
         """
         Save report to database (legacy method - for backward compatibility)
@@ -258,13 +322,13 @@ class ProctoringService(IProctoringService):
                 }
             }
 
-            self.repository.save_report(session_id, candidate_id, report_with_metadata, video_duration, fps)
+            await self.repository.save_report(session_id, candidate_id, report_with_metadata, video_duration, fps)
             debug_logger.info(f"Report saved for session: {session_id}")
         except Exception as e:
             debug_logger.error(f"Failed to save report for session {session_id}: {str(e)}")
             raise DatabaseError(f"Failed to save report: {str(e)}", 5002)
 
-    def _save_complete_report(self, interview_id: str, report: Dict,
+    async def _save_complete_report(self, interview_id: str, report: Dict,
                              video_duration: float = 0.0, fps: float = 12.0):
         """
         Save complete proctoring report with all events and summaries to database
@@ -290,7 +354,7 @@ class ProctoringService(IProctoringService):
             risk_score, risk_level = self._calculate_risk_from_events(gestures)
 
             # Save proctoring report with risk assessment
-            self.repository.save_proctoring_report(
+            await self.repository.save_proctoring_report(
                 interview_id=interview_id,
                 interview_date=date.today(),
                 cheating_likelihood_score=risk_score,
@@ -299,7 +363,7 @@ class ProctoringService(IProctoringService):
             debug_logger.info(f"Proctoring report saved: risk_level={risk_level}, score={risk_score}")
 
             # Save individual events and summaries
-            self._save_events_and_summaries(interview_id, gestures)
+            await self._save_events_and_summaries(interview_id, gestures)
 
         except DatabaseError:
             raise
@@ -459,7 +523,7 @@ class ProctoringService(IProctoringService):
             return str(value)
         return None
 
-    def _save_events_and_summaries(self, interview_id: str, gestures: List):
+    async def _save_events_and_summaries(self, interview_id: str, gestures: List):
         """
         Save individual events and summaries to database
 
@@ -469,7 +533,9 @@ class ProctoringService(IProctoringService):
         """
         from datetime import datetime
 
-        # Group events by type and save summaries and individual events
+        # Collect rows for all gestures, then insert each table in one batch
+        event_logs = []
+        summaries = []
         for gesture in gestures:
             gesture_name = gesture.get("name", "unknown")
             occurrences = gesture.get("occurrence", [])
@@ -491,7 +557,7 @@ class ProctoringService(IProctoringService):
                 else:
                     event_timestamp = datetime.now()
 
-                self.repository.save_event_log(
+                event_logs.append(dict(
                     interview_id=interview_id,
                     event_type=gesture_name,
                     event_timestamp=event_timestamp,
@@ -505,8 +571,7 @@ class ProctoringService(IProctoringService):
                         direction=occurrence.get("direction", None),
                         duration_seconds=self._parse_numeric_value(occurrence.get("duration")) or 0.0,
                     ),
-                )
-            debug_logger.info(f"Saved {total_count} individual event logs for gesture: {gesture_name}")
+                ))
 
             # Calculate counts by severity
             normal_count = int(total_count * 0.3)  # Assume 30% normal
@@ -516,8 +581,7 @@ class ProctoringService(IProctoringService):
             # Calculate total duration
             total_duration = sum(self._parse_numeric_value(o.get("duration")) or 0.0 for o in occurrences)
 
-            # Save event summary
-            self.repository.save_event_summary(
+            summaries.append(dict(
                 interview_id=interview_id,
                 event_type=gesture_name,
                 total_count=total_count,
@@ -526,10 +590,14 @@ class ProctoringService(IProctoringService):
                 high_risk_count=high_risk_count,
                 total_duration=total_duration,
                 correlated_count=0
-            )
-            debug_logger.info(f"Saved event summary: {gesture_name} ({total_count} events, {total_duration:.1f}s duration)")
+            ))
+            debug_logger.info(f"Prepared event summary: {gesture_name} ({total_count} events, {total_duration:.1f}s duration)")
+
+        saved_logs = await self.repository.save_event_logs(event_logs)
+        saved_summaries = await self.repository.save_event_summaries(summaries)
+        debug_logger.info(f"Saved {saved_logs} event logs and {saved_summaries} event summaries for interview: {interview_id}")
 
-    def get_report(self, session_id: str) -> Optional[Dict]:
+    async def get_report(self, session_id: str) -> Optional[Dict]:
         """
         Retrieve proctoring report by session ID
 
@@ -544,7 +612,7 @@ class ProctoringService(IProctoringService):
             DatabaseError: If database query fails
         """
         try:
-            report = self.repository.get_report_by_session(session_id)
+            report = await self.repository.get_report_by_session(session_id)
 
             if not report:
                 debug_logger.warning(f"Report not found for session: {session_id}")
@@ -558,7 +626,7 @@ class ProctoringService(IProctoringService):
             debug_logger.error(f"Error retrieving report for session {session_id}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve report: {str(e)}", 5003)
 
-    def get_candidate_reports(self, candidate_id: str, limit: int = 10) -> Dict:
+    async def get_candidate_reports(self, candidate_id: str, limit: int = 10) -> Dict:
         """
         Retrieve all reports for a candidate
 
@@ -573,7 +641,7 @@ class ProctoringService(IProctoringService):
             DatabaseError: If database query fails
         """
         try:
-            reports = self.repository.get_reports_by_candidate(candidate_id, limit)
+            reports = await self.repository.get_reports_by_candidate(candidate_id, limit)
 
             debug_logger.info(f"Retrieved {len(reports)} reports for candidate: {candidate_id}")
 
@@ -587,7 +655,21 @@ class ProctoringService(IProctoringService):
             debug_logger.error(f"Error retrieving reports for candidate {candidate_id}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve candidate reports: {str(e)}", 5004)
 
-    def delete_report(self, session_id: str) -> Dict:
+    def stream_candidate_reports(self, candidate_id: str, limit: int = 10) -> AsyncIterator[Dict]:
+        """
+        Stream reports for a candidate without materializing the full list
+
+        Args:
+            candidate_id: Candidate identifier
+            limit: Maximum reports to stream
+
+        Returns:
+            Async iterator of report dictionaries
+        """
+        debug_logger.info(f"Streaming up to {limit} reports for candidate: {candidate_id}")
+        return self.repository.stream_reports_by_candidate(candidate_id, limit)
+
+    async def delete_report(self, session_id: str) -> Dict:
         """
         Delete report (GDPR compliance)
 
@@ -602,7 +684,8 @@ class ProctoringService(IProctoringService):
             DatabaseError: If delete operation fails
         """
         try:
-            success = self.repository.delete_report(session_id)
+            success = await self.repository.delete_report(session_id)
+            cache.invalidate_report(session_id)
 
             if not success:
                 debug_logger.warning(f"Report not found for deletion: {session_id}")
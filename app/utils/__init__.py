@@ -1,4 +1,12 @@
 """Utility modules"""
-from .logger import debug_logger
+from .ids import new_id, uuid7
 
-__all__ = ['debug_logger']
+__all__ = ['debug_logger', 'new_id', 'uuid7']
+
+
+def __getattr__(name: str):
+    # debug_logger is created on first access (see app.utils.logger)
+    if name != 'debug_logger':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .logger import debug_logger
+    return debug_logger
@@ -1,45 +1,111 @@
+import atexit
 import logging
-from datetime import datetime, timezone, timedelta
+import logging.handlers
 import os
-from types import TracebackType
-from typing import Mapping
-from pathlib import Path
-
-from dotenv import load_dotenv
-import glob
-
-load_dotenv()
-ENV = os.getenv('APP_ENV')
+import queue
+import threading
+import time
+from typing import Optional
+
+# File records are buffered and written in batches of this many; WARNING and
+# above flush immediately so problems reach disk without delay
+LOG_BUFFER_CAPACITY = 256
+
+# findCaller() result when caller info is skipped (logging's own placeholder)
+_NO_CALLER = ("(unknown file)", 0, "(unknown function)", None)
+
+# Logging methods DebugLogger forwards to its Logger
+_LOG_METHODS = frozenset(('debug', 'info', 'warning', 'error', 'critical', 'exception'))
+
+# Logs live in <repo root>/debug_logs; joined once at import
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_LOG_DIR = "debug_logs"
+_LOGS_DIR = os.path.join(_ROOT_DIR, _LOG_DIR)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread
+    The queue never leaves the process, so records need not be made
+    picklable; log call arguments must not be mutated after the call
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _DailyFileHandler(logging.FileHandler):
+    """
+    Appends to debug_logs_<UTC date>.log and moves to the next day's file at
+    UTC midnight. Files are never renamed, so every process (API workers,
+    analysis pool) can append to the same directory safely
+    """
+
+    def __init__(self, logs_dir: str, on_rollover=None, encoding: str = 'utf-8'):
+        self._logs_dir = logs_dir
+        self._on_rollover = on_rollover
+        self._next_rollover = 0.0
+        super().__init__(self._filename_for(time.time()), encoding=encoding, delay=True)
+
+    def _filename_for(self, timestamp: float) -> str:
+        # The date string is built once per day, not per record
+        day = int(timestamp // 86400)
+        self._next_rollover = (day + 1) * 86400.0
+        current_date = time.strftime("%Y-%m-%d", time.gmtime(day * 86400))
+        return os.path.join(self._logs_dir, f"debug_logs_{current_date}.log")
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Called with the handler lock held
+        if record.created >= self._next_rollover:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None  # reopened lazily by FileHandler.emit
+            self.baseFilename = os.path.abspath(self._filename_for(record.created))
+            if self._on_rollover is not None:
+                self._on_rollover()
+        super().emit(record)
 
 
 class DebugLogger:
+    # Held while a cleanup runs so concurrent instances don't race on unlink
+    _cleanup_lock = threading.Lock()
+
     def __init__(self, logger_name="debug_logger"):
         self._logger_name = logger_name
-        # Calculate paths directly here instead
-        self._root_dir = Path(__file__).resolve().parents[2]
-        self._log_dir = "debug_logs"
-        self._logs_dir = str(self._root_dir / self._log_dir)
+        self._root_dir = _ROOT_DIR
+        self._log_dir = _LOG_DIR
+        self._logs_dir = _LOGS_DIR
         self._debug_logger: logging.Logger = self._create_logger()
-        self._clean_old_logs()
+        self._start_cleanup()
 
     def _create_logger(self):
         """Creates and returns a logger with date-wise log files."""
         logger = logging.getLogger(self._logger_name)
         logger.setLevel(logging.DEBUG)
 
-        current_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        log_filename = str(Path(self._logs_dir) / f"debug_logs_{current_date}.log")
+        # No format here uses pathname/lineno/funcName: skip findCaller's stack
+        # walk for this logger unless a call asks for stack_info
+        find_caller = logger.findCaller
+
+        def _find_caller(stack_info=False, stacklevel=1):
+            if stack_info:
+                # +1 for this frame, which logging does not treat as internal
+                return find_caller(stack_info, stacklevel + 1)
+            return _NO_CALLER
+
+        logger.findCaller = _find_caller
 
         # Ensure the log directory exists
-        if not os.path.exists(self._logs_dir):
-            os.makedirs(self._logs_dir)
+        os.makedirs(self._logs_dir, exist_ok=True)
 
         # Clear existing handlers to avoid duplicates
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
 
         # Define log file and console handlers with UTF-8 encoding
-        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        # Each UTC day gets its own file; crossing midnight also starts an
+        # old-log cleanup so long-running processes keep pruning
+        file_handler = _DailyFileHandler(self._logs_dir, on_rollover=self._start_cleanup)
         console_handler = logging.StreamHandler()
 
         # Force UTF-8 encoding for console handler on Windows
@@ -61,108 +127,121 @@ class DebugLogger:
         file_handler.setFormatter(file_format)
         console_handler.setFormatter(console_format)
 
-        # Attach handlers to logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Batch file writes; the buffer is flushed on WARNING+, when full and
+        # by logging.shutdown() at interpreter exit (flushOnClose)
+        buffered_file_handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True,
+        )
+
+        # Callers only enqueue; formatting and file/console I/O run on the
+        # listener thread
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler = _DeferredQueueHandler(self._log_queue)
+        self._handlers = (buffered_file_handler, console_handler)
+        self._start_listener()
+        atexit.register(self._stop_listener)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reinit_after_fork)
+
+        logger.addHandler(self._queue_handler)
 
         # Prevent propagation to root logger to avoid duplicate logs
         logger.propagate = False
 
         return logger
 
+    def _start_listener(self) -> None:
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, *self._handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def _reinit_after_fork(self) -> None:
+        """
+        A forked child has no listener thread and inherits the parent's
+        pending records, which the parent writes itself: start clean
+        """
+        self._log_queue = queue.SimpleQueue()
+        self._queue_handler.queue = self._log_queue
+        self._handlers[0].buffer.clear()
+        self._start_listener()
+
+    def _stop_listener(self) -> None:
+        """Drain queued records; runs before logging.shutdown() flushes the handlers"""
+        self._listener.stop()
+
+    def _start_cleanup(self) -> None:
+        # Old-log cleanup is housekeeping; don't hold up logging
+        threading.Thread(target=self._clean_old_logs, name='log-cleanup', daemon=True).start()
+
     def _clean_old_logs(self, days_to_keep=30):
+        if not self._cleanup_lock.acquire(blocking=False):
+            return []  # another cleanup is already running
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-
-            # Find all .log files in the directory
-            log_files = glob.glob(os.path.join(self._logs_dir, "*.log"))
+            # Integer nanosecond cutoff: no float or datetime work per file
+            cutoff_ns = time.time_ns() - days_to_keep * 86_400 * 1_000_000_000
 
+            # One directory pass; the file type comes from the directory entry
             deleted_files = []
-            for log_file in log_files:
-                # Get file modification time
-                file_mod_time = datetime.fromtimestamp(os.path.getmtime(log_file))
-
-                if file_mod_time < cutoff_date:
-                    os.remove(log_file)
-                    deleted_files.append(log_file)
-                    print(f"Deleted: {log_file}")
-
+            with os.scandir(self._logs_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".log") or not entry.is_file(follow_symlinks=False):
+                        continue
+                    if entry.stat().st_mtime_ns < cutoff_ns:
+                        os.remove(entry.path)
+                        deleted_files.append(entry.path)
+
+            # One buffered, level-gated record instead of a print per file
             if deleted_files:
-                print(f"Cleanup completed: Deleted {len(deleted_files)} old log files")
+                self._debug_logger.debug("Deleted %d old logs: %s", len(deleted_files), deleted_files)
             else:
-                print("No old log files found to delete")
+                self._debug_logger.debug("No old log files found to delete")
 
             return deleted_files
 
         except Exception as e:
-            print(f"Error cleaning up logs: {e}")
+            self._debug_logger.error("Error cleaning up logs: %s", e)
             return []
-
-    def info(self,
-             msg: object,
-             *args: object,
-             exc_info: None | bool | tuple[type[BaseException], BaseException, TracebackType | None] | tuple[
-                 None, None, None] | BaseException = None,
-             stack_info: bool = False,
-             stacklevel: int = 1,
-             extra: Mapping[str, object] | None = None) -> None:
-        self._debug_logger.info(msg, *args, exc_info=exc_info, stack_info=stack_info, extra=extra,
-                                stacklevel=stacklevel)
-
-    def debug(self,
-              msg: object,
-              *args: object,
-              exc_info: None | bool | tuple[type[BaseException], BaseException, TracebackType | None] | tuple[
-                  None, None, None] | BaseException = None,
-              stack_info: bool = False,
-              stacklevel: int = 1,
-              extra: Mapping[str, object] | None = None) -> None:
-        self._debug_logger.debug(msg, *args, exc_info=exc_info, stack_info=stack_info, extra=extra,
-                                 stacklevel=stacklevel)
-
-    def warning(self,
-                msg: object,
-                *args: object,
-                exc_info: None | bool | tuple[type[BaseException], BaseException, TracebackType | None] | tuple[
-                    None, None, None] | BaseException = None,
-                stack_info: bool = False,
-                stacklevel: int = 1,
-                extra: Mapping[str, object] | None = None) -> None:
-        self._debug_logger.warning(msg, *args, exc_info=exc_info, stack_info=stack_info, extra=extra,
-                                   stacklevel=stacklevel)
-
-    def error(self,
-              msg: object,
-              *args: object,
-              exc_info: None | bool | tuple[type[BaseException], BaseException, TracebackType | None] | tuple[
-                  None, None, None] | BaseException = None,
-              stack_info: bool = False,
-              stacklevel: int = 1,
-              extra: Mapping[str, object] | None = None) -> None:
-        self._debug_logger.error(msg, *args, exc_info=exc_info, stack_info=stack_info, extra=extra,
-                                 stacklevel=stacklevel)
-
-    def critical(self,
-                 msg: object,
-                 *args: object,
-                 exc_info: None | bool | tuple[type[BaseException], BaseException, TracebackType | None] | tuple[
-                     None, None, None] | BaseException = None,
-                 stack_info: bool = False,
-                 stacklevel: int = 1,
-                 extra: Mapping[str, object] | None = None) -> None:
-        self._debug_logger.critical(msg, *args, exc_info=exc_info, stack_info=stack_info, extra=extra,
-                                    stacklevel=stacklevel)
-
-    def exception(self,
-                  msg: object,
-                  *args: object,
-                  exc_info: None | bool | tuple[type[BaseException], BaseException, TracebackType | None] | tuple[
-                      None, None, None] | BaseException = True,
-                  stack_info: bool = False,
-                  stacklevel: int = 1,
-                  extra: Mapping[str, object] | None = None) -> None:
-        self._debug_logger.exception(msg, *args, exc_info=exc_info, stack_info=stack_info, extra=extra,
-                                     stacklevel=stacklevel)
-
-
-debug_logger = DebugLogger()
+        finally:
+            self._cleanup_lock.release()
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self._debug_logger.isEnabledFor(level)
+
+    def __getattr__(self, name: str):
+        # debug/info/warning/error/critical/exception resolve to the underlying
+        # Logger's bound methods and are cached on the instance, so a log call
+        # goes straight to Logger (which checks the level first) with no
+        # wrapper frame or re-packed keyword arguments
+        if name not in _LOG_METHODS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        method = getattr(self._debug_logger, name)
+        setattr(self, name, method)
+        return method
+
+
+_instance: Optional[DebugLogger] = None
+_instance_lock = threading.Lock()
+
+
+def get_debug_logger() -> DebugLogger:
+    """Return the process-wide DebugLogger, creating it on first use"""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = DebugLogger()
+    return _instance
+
+
+def __getattr__(name: str):
+    # `debug_logger` is built on first access (PEP 562): importing this module
+    # opens no files and scans no directories
+    if name != 'debug_logger':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    logger = get_debug_logger()
+    globals()[name] = logger
+    return logger
@@ -0,0 +1,16 @@
+"""
+Gunicorn worker classes for serving the FastAPI app
+"""
+from uvicorn.workers import UvicornWorker
+
+
+class ProctoringUvicornWorker(UvicornWorker):
+    """
+    Uvicorn worker pinned to the uvloop event loop and the httptools parser
+    (both C/Cython), instead of relying on uvicorn's "auto" detection
+    """
+    CONFIG_KWARGS = {
+        **UvicornWorker.CONFIG_KWARGS,
+        "loop": "uvloop",
+        "http": "httptools",
+    }
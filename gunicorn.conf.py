@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for production deployments
+
+    gunicorn -c gunicorn.conf.py
+
+The app is imported once in the master (preload_app) and workers are forked
+from it, so heavy imports (OpenCV, MediaPipe, NumPy) are shared copy-on-write
+instead of being loaded again by every worker. Database engines and the
+video process pool are created lazily per worker (lifespan / first request),
+never in the master.
+"""
+import os
+
+wsgi_app = "app.main:app"
+worker_class = "app.workers.ProctoringUvicornWorker"
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+# Video analysis already fans out to a per-worker process pool, so the usual
+# 2 * cores + 1 would oversubscribe the CPU; keep the count explicit
+workers = int(os.getenv("GUNICORN_WORKERS") or os.getenv("WEB_CONCURRENCY") or "4")
+# Workers inherit this, so each sizes its video process pool to its CPU share
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+preload_app = True
+
+loglevel = os.getenv("LOG_LEVEL", "info")